@@ -13,6 +13,7 @@ Date: 2026
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 import numpy as np
 import plotly.express as px
@@ -21,6 +22,8 @@ from datetime import datetime, timedelta
 import os
 import json
 import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 from stats_utils import (
     get_player_overall_stats,
@@ -33,6 +36,7 @@ from stats_utils import (
     get_map_distribution,
     get_players_by_team,
 )
+from config import get_player_position
 
 try:
     from scrape_breakingpoint import update_data, get_data_status
@@ -52,6 +56,54 @@ CDL_MAPS = {
     'Overload': ['Den', 'Exposure', 'Scar']
 }
 
+# Low-cardinality string columns stored as pandas categoricals after load
+CATEGORY_COLUMNS = [
+    'team_name', 'opponent_team_name', 'map_name', 'mode', 'player_name',
+    'position', 'season', 'event_name', 'series_type',
+]
+
+# Local Parquet copy of the prepared stats for fast cold starts; the .meta file holds the scrape key it was written for
+STATS_PARQUET_PATH = 'data/cache.parquet'
+STATS_PARQUET_META_PATH = 'data/cache.parquet.meta'
+
+# Narrow dtypes for betting lines (line_value stays float64 so 1.1 lines are not shown as 1.100000023)
+BETTING_LINE_DTYPES = {
+    'id': 'int32', 'match_id': 'category', 'player_name': 'category', 'team_name': 'category',
+    'stat_type': 'category', 'map_scope': 'category', 'map_number': 'Int8',
+}
+
+# Team-based row colors for match tables (each opponent team gets a consistent color)
+TEAM_COLORS = {
+    'Boston Breach': '#D6EAF8',          # Light blue
+    'Carolina Royal Ravens': '#FCF3CF',  # Light yellow
+    'Cloud9 New York': '#D5F4E6',        # Light green
+    'FaZe Vegas': '#FADBD8',             # Light red/pink
+    'G2 Minnesota': '#E8DAEF',           # Light purple
+    'Los Angeles Thieves': '#FAE5D3',    # Light orange
+    'Miami Heretics': '#D5DBDB',         # Light gray
+    'OpTic Texas': '#D4EFDF',            # Mint green
+    'Paris Gentle Mates': '#E3F2FD',     # Sky blue
+    'Riyadh Falcons': '#FFF9C4',         # Pale yellow
+    'Toronto KOI': '#C8E6C9',            # Pale green
+    'Vancouver Surge': '#F8BBD0',        # Pink
+}
+
+# Team rosters used to order players on the overview page
+TEAM_PLAYER_MAP = {
+    'Boston Breach': ['Cammy', 'Snoopy', 'Purj', 'Nastie'],
+    'Carolina Royal Ravens': ['SlasheR', 'Nero', 'Lurqxx', 'Craze'],
+    'Cloud9 New York': ['Mack', 'Afro', 'Beans', 'Vivid'],
+    'FaZe Vegas': ['Drazah', 'Abuzah', '04', 'Simp'],
+    'G2 Minnesota': ['Skyz', 'Estreal', 'Kremp', 'Mamba'],
+    'Los Angeles Thieves': ['aBeZy', 'HyDra', 'Scrap', 'Kenny'],
+    'Miami Heretics': ['MettalZ', 'Traixx', 'SupeR', 'RenKoR'],
+    'OpTic Texas': ['Shotzzy', 'Dashy', 'Huke', 'Mercules'],
+    'Paris Gentle Mates': ['Envoy', 'Ghosty', 'Neptune', 'Sib'],
+    'Riyadh Falcons': ['Cellium', 'Pred', 'Exnid', 'KiSMET'],
+    'Toronto KOI': ['ReeaL', 'CleanX', 'JoeDeceives', 'Insight'],
+    'Vancouver Surge': ['Abe', 'Gwinn', 'Lunarz', 'Lqgend'],
+}
+
 def filter_cdl_maps(df: pd.DataFrame) -> pd.DataFrame:
     """Filter dataframe to only include official CDL maps for each mode"""
     if df is None or df.empty:
@@ -856,10 +908,11 @@ st.markdown("""
 # DATA LOADING & CACHING
 # ============================================================================
 
-@st.cache_data(ttl=600, show_spinner=False)
+@st.cache_resource(ttl=600, show_spinner=False)
 def load_player_images_cached():
     """
     Cached version of player images loading.
+    Uses cache_resource so all sessions share one read-only dict.
     TTL of 600 seconds (10 minutes).
     """
     try:
@@ -870,6 +923,53 @@ def load_player_images_cached():
         return {}
 
 
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_upcoming_matches_cached():
+    """
+    Cached scrape of upcoming CDL matches, so reruns (slip picks, tab clicks)
+    do not refetch breakingpoint.gg. Cleared by the Refresh buttons.
+    TTL of 600 seconds (10 minutes).
+    """
+    from scrape_breakingpoint import fetch_upcoming_matches
+    return fetch_upcoming_matches()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_betting_lines_cached():
+    """
+    Cached betting lines from the database.
+    Cleared whenever lines are saved. TTL of 300 seconds (5 minutes).
+    """
+    from database import load_betting_lines
+    lines = load_betting_lines()
+    if lines is None:
+        return None
+    return lines.astype(BETTING_LINE_DTYPES)
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def load_image_index(directory):
+    """
+    Cached {file stem: path} index of the PNG images in a directory.
+    Replaces a filesystem hit (and exception on a miss) per rendered image.
+    TTL of 600 seconds (10 minutes).
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name[:-4]: entry.path for entry in entries if entry.name.endswith('.png')}
+    except OSError:
+        return {}
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_player_image_url(player_name):
+    """
+    Cached lookup of a single player's image URL.
+    TTL of 600 seconds (10 minutes).
+    """
+    return load_player_images_cached().get(player_name)
+
+
 def show_loading_animation(message="Loading CDL Data", subtext="Please wait while we fetch the latest stats..."):
     """Display an aesthetic loading animation"""
     return st.markdown(f"""
@@ -880,28 +980,121 @@ def show_loading_animation(message="Loading CDL Data", subtext="Please wait whil
         </div>
     """, unsafe_allow_html=True)
 
+@st.cache_data(ttl=30, show_spinner=False)
+def get_last_scrape_date_cached():
+    """
+    Cached last scrape date for the top bar and the stats cache key.
+    TTL of 30 seconds.
+    """
+    from database import get_last_scrape_date
+    return get_last_scrape_date()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_cache_stats_cached():
+    """
+    Cached database match/player record counts for the top bar.
+    TTL of 30 seconds.
+    """
+    return get_cache_stats()
+
+
+def read_stats_parquet(scrape_key):
+    """Prepared stats from the local Parquet copy if it was written for scrape_key, else None."""
+    try:
+        with open(STATS_PARQUET_META_PATH, 'r') as f:
+            if f.read() != str(scrape_key):
+                return None
+        return pd.read_parquet(STATS_PARQUET_PATH)
+    except Exception:
+        return None
+
+
+def write_stats_parquet(df, scrape_key):
+    """Save the prepared stats as the local Parquet copy for scrape_key."""
+    try:
+        remove_stats_parquet()
+        df.to_parquet(STATS_PARQUET_PATH, compression='zstd')
+        with open(STATS_PARQUET_META_PATH, 'w') as f:
+            f.write(str(scrape_key))
+    except Exception as e:
+        print(f"⚠️ Could not write stats Parquet cache: {e}")
+
+
+def remove_stats_parquet():
+    """Delete the local Parquet copy (meta first, so a half-removed copy is never read)."""
+    for path in (STATS_PARQUET_META_PATH, STATS_PARQUET_PATH):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def load_stats_from_cache(scrape_key):
+    """
+    Cached database load of the player stats, prepared for the pages.
+    Keyed on the last scrape date so a refresh loads the new rows; a fresh
+    process reads the local Parquet copy for that key instead of the database.
+    TTL of 300 seconds (5 minutes).
+    """
+    from database import load_from_cache
+    
+    df = read_stats_parquet(scrape_key)
+    if df is not None:
+        return df
+    
+    df = load_from_cache()
+    
+    # Raise rather than return an empty frame so a failed read is not cached for the TTL
+    if df is None:
+        raise RuntimeError("could not read player stats from the database")
+    if df.empty:
+        return pd.DataFrame()
+    
+    # Convert date column to datetime
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'])
+    
+    # Filter to only official CDL maps
+    df = filter_cdl_maps(df)
+    
+    # Low-cardinality string columns as categoricals (integer-coded filters and groupbys)
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    # Narrow integer stat columns; damage and rating stay float64 so rounded averages display exactly
+    for col in ['map_number', 'game_num', 'kills', 'deaths', 'assists']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in ['damage', 'rating']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col])
+    
+    write_stats_parquet(df, scrape_key)
+    
+    return df
+
+
+def clear_data_caches():
+    """Drop the cached stats load, its Parquet copy and the top bar lookups after new data is scraped."""
+    remove_stats_parquet()
+    load_stats_from_cache.clear()
+    get_last_scrape_date_cached.clear()
+    get_cache_stats_cached.clear()
+
+
 def load_data_with_refresh() -> pd.DataFrame:
     """
     Load CDL stats data from database cache.
     Returns filtered DataFrame with CDL maps only.
     """
-    from database import load_from_cache, init_db
+    from database import init_db
     
     try:
         init_db()
-        df = load_from_cache()
-        
-        if df is not None and not df.empty:
-            # Convert date column to datetime
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
-            
-            # Filter to only official CDL maps
-            df = filter_cdl_maps(df)
-            
-            return df
-        else:
-            return pd.DataFrame()
+        return load_stats_from_cache(get_last_scrape_date_cached())
             
     except Exception as e:
         st.error(f"Error loading data from database: {e}")
@@ -944,6 +1137,7 @@ def refresh_data():
             
             # Update last scrape date to now
             update_last_scrape_date(datetime.now())
+            clear_data_caches()
             
             st.success(f"✅ Successfully refreshed! Added {len(new_df)} new player records.")
             
@@ -964,6 +1158,23 @@ def refresh_data():
         return False
 
 
+def data_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Content hash of a stats frame.
+    Used as data_version, the key of every cached function that reads
+    st.session_state.df: st.cache_data is shared by all sessions, so the key
+    must change with the data itself, not with a per-session counter.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return hashlib.sha1(row_hashes.tobytes() + '|'.join(map(str, df.columns)).encode()).hexdigest()
+
+
+def store_session_data(df: pd.DataFrame):
+    """Put a loaded frame in session state along with its data_version fingerprint."""
+    st.session_state.df = df
+    st.session_state['data_version'] = data_fingerprint(df)
+
+
 # Legacy function for backward compatibility
 def load_data(csv_path: str = "data/breakingpoint_cod_stats.csv") -> pd.DataFrame:
     """Legacy function - now just calls load_data_with_refresh()"""
@@ -975,7 +1186,7 @@ def load_data(csv_path: str = "data/breakingpoint_cod_stats.csv") -> pd.DataFram
 # ============================================================================
 
 @st.cache_data(ttl=300, show_spinner=False)
-def get_filtered_data_cached(df_hash, selected_seasons_tuple, selected_events_tuple, lan_options_tuple):
+def get_filtered_data_cached(data_version, selected_seasons_tuple, selected_events_tuple, lan_options_tuple):
     """
     Cached version of filter operations to avoid recomputing on every page load.
     Uses tuple parameters for hashability.
@@ -1014,21 +1225,42 @@ def get_filtered_data(selected_seasons=None, selected_events=None, lan_options=N
     """Apply filters to the dataframe without rendering UI - uses caching for performance."""
     # If no filters provided, use all data
     if selected_seasons is None:
-        selected_seasons = sorted(st.session_state.df['season'].unique())
+        selected_seasons = _unique_sorted(st.session_state.get('data_version', 0), 'season')
     if selected_events is None:
-        selected_events = sorted(st.session_state.df['event_name'].unique())
+        selected_events = _unique_sorted(st.session_state.get('data_version', 0), 'event_name')
     if lan_options is None:
         lan_options = ["LAN", "Online"]
     
-    # Create a hash of the dataframe for cache invalidation
-    df_hash = hash(str(st.session_state.df.shape) + str(st.session_state.df.columns.tolist()))
+    # Fingerprint of st.session_state.df (see data_fingerprint), so it doubles as the cache key
+    data_version = st.session_state.get('data_version', 0)
     
     # Convert lists to tuples for hashability
     seasons_tuple = tuple(sorted(selected_seasons)) if selected_seasons else tuple()
     events_tuple = tuple(sorted(selected_events)) if selected_events else tuple()
     lan_tuple = tuple(sorted(lan_options)) if lan_options else tuple()
     
-    return get_filtered_data_cached(df_hash, seasons_tuple, events_tuple, lan_tuple)
+    return get_filtered_data_cached(data_version, seasons_tuple, events_tuple, lan_tuple)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_map_level(data_version):
+    """
+    Cached map-level view of the data: one row per (match_id, map_number, team_name).
+    Record calculations scan this instead of the per-player rows.
+    TTL of 600 seconds (10 minutes).
+    """
+    df = st.session_state.df
+    columns = [
+        col for col in ['match_id', 'map_number', 'team_name', 'mode', 'won_map', 'map_name', 'season', 'event_name']
+        if col in df.columns
+    ]
+    return df.drop_duplicates(['match_id', 'map_number', 'team_name'])[columns].reset_index(drop=True)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _unique_sorted(data_version, col):
+    """Cached sorted unique values of a column of the full dataset (filter option lists)."""
+    return sorted(st.session_state.df[col].unique().tolist())
 
 
 def render_sidebar_filters():
@@ -1069,8 +1301,7 @@ def page_data_overview():
     st.markdown("### 👥 Player Statistics")
     
     # Load player images
-    if 'player_images' not in st.session_state:
-        st.session_state.player_images = load_player_images_cached()
+    player_images = load_player_images_cached()
     
     # Page-level filters for player stats
     st.markdown("**Filters:**")
@@ -1156,18 +1387,27 @@ def page_data_overview():
     if selected_opponent:
         player_filtered_df = player_filtered_df[player_filtered_df['opponent_team_name'] == selected_opponent]
     
-    # Map result to boolean
-    result_bool_map = {}
-    if "Won" in result_options:
-        result_bool_map[True] = True
-    if "Lost" in result_options:
-        result_bool_map[False] = True
+    # Map result to boolean (both or neither selected means no filtering needed)
+    wanted_results = [value for value, label in ((True, "Won"), (False, "Lost")) if label in result_options]
+    if len(wanted_results) == 1:
+        player_filtered_df = player_filtered_df[player_filtered_df['won_map'] == wanted_results[0]]
+    
+    # Team filter
+    teams_list = sorted(filtered_df['team_name'].unique())
+    selected_team = st.selectbox(
+        "Filter by Team (or select 'All Teams')",
+        ["All Teams"] + teams_list,
+        key="player_team_filter"
+    )
     
-    if result_bool_map:
-        player_filtered_df = player_filtered_df[player_filtered_df['won_map'].isin(result_bool_map.keys())]
+    # Narrow to the selected team before aggregating so the groupby only sees its rows
+    # (charts below still use the full player_filtered_df)
+    stats_source_df = player_filtered_df
+    if selected_team != "All Teams":
+        stats_source_df = stats_source_df[stats_source_df['team_name'] == selected_team]
     
     # Calculate player aggregate stats (average across all their maps in filtered data)
-    player_stats = player_filtered_df.groupby('player_name').agg({
+    player_stats = stats_source_df.groupby('player_name', observed=True).agg({
         'kills': 'mean',
         'deaths': 'mean',
         'assists': 'mean',
@@ -1183,17 +1423,6 @@ def page_data_overview():
     # Calculate K/D ratio
     player_stats['K/D'] = (player_stats['Avg_Kills'] / player_stats['Avg_Deaths']).round(2)
     
-    # Team filter
-    teams_list = sorted(filtered_df['team_name'].unique())
-    selected_team = st.selectbox(
-        "Filter by Team (or select 'All Teams')",
-        ["All Teams"] + teams_list,
-        key="player_team_filter"
-    )
-    
-    if selected_team != "All Teams":
-        player_stats = player_stats[player_stats['Team'] == selected_team]
-    
     # View selection
     view_type = st.radio(
         "Display view:",
@@ -1220,7 +1449,7 @@ def page_data_overview():
         for idx, (_, row) in enumerate(player_stats.iterrows()):
             with cols[idx % 3]:
                 player_name = row['Player']
-                image_url = st.session_state.player_images.get(player_name)
+                image_url = player_images.get(player_name)
                 
                 # Display player image if available
                 if image_url:
@@ -1358,46 +1587,57 @@ def page_data_overview():
 # TEAM DETAIL PAGE
 # ============================================================================
 
+def _team_map_totals(df):
+    """
+    Sum kills and deaths per (match_id, map_number, team_name) in a single groupby.
+    Cast to int because a NULL stat leaves the columns float.
+    """
+    totals = df.groupby(['match_id', 'map_number', 'team_name'], observed=True, sort=False)[['kills', 'deaths']].sum()
+    return totals.astype(int)
+
+
 @st.cache_data(ttl=300, show_spinner=False)
-def calculate_map_scores_cached(df_hash, player_name, match_ids_tuple, map_numbers_tuple, data_version='v2'):
+def _all_map_scores(data_version):
     """
-    Cached calculation of map scores using actual game scores (HP points, S&D rounds, Overload caps).
-    Falls back to kills-deaths if score data not available.
+    Cached map scores for every (match_id, map_number, team_name) in the dataset,
+    using actual game scores (HP points, S&D rounds, Overload caps).
+    Falls back to team kills-deaths if score data not available.
     TTL of 300 seconds (5 minutes).
-    data_version parameter forces cache invalidation after data refresh.
     """
     full_df = st.session_state.df
-    player_df = full_df[full_df['player_name'] == player_name]
-    map_scores = {}
-    
-    match_ids = set(match_ids_tuple)
-    map_numbers = set(map_numbers_tuple)
-    
-    for match_id in match_ids:
-        for map_number in map_numbers:
-            map_key = (match_id, map_number)
-            # Get player's row for this specific map to get team_score and opponent_score
-            player_map_data = player_df[(player_df['match_id'] == match_id) & 
-                                       (player_df['map_number'] == map_number)]
-            
-            if not player_map_data.empty:
-                # Try to use actual game scores first
-                first_row = player_map_data.iloc[0]
-                if pd.notna(first_row.get('team_score')) and pd.notna(first_row.get('opponent_score')):
-                    team_score = int(first_row['team_score'])
-                    opponent_score = int(first_row['opponent_score'])
-                    map_scores[map_key] = f"{team_score}-{opponent_score}"
-                else:
-                    # Fallback: Get ALL players on this team for this map to calculate team total
-                    team_name = first_row['team_name']
-                    all_team_data = full_df[(full_df['match_id'] == match_id) & 
-                                           (full_df['map_number'] == map_number) &
-                                           (full_df['team_name'] == team_name)]
-                    team_kills = all_team_data['kills'].sum()
-                    team_deaths = all_team_data['deaths'].sum()
-                    map_scores[map_key] = f"{int(team_kills)}-{int(team_deaths)}"
+    if full_df.empty:
+        return {}
+    
+    keys = ['match_id', 'map_number', 'team_name']
     
-    return map_scores
+    # Fallback: team kills-deaths totals for ALL players on the team for that map
+    team_totals = _team_map_totals(full_df)
+    scores = team_totals['kills'].astype(str) + '-' + team_totals['deaths'].astype(str)
+    
+    # Prefer actual game scores where recorded
+    if 'team_score' in full_df.columns and 'opponent_score' in full_df.columns:
+        head = full_df.drop_duplicates(keys).set_index(keys)
+        scored = head[head['team_score'].notna() & head['opponent_score'].notna()]
+        if not scored.empty:
+            scores.update(
+                scored['team_score'].astype(int).astype(str) + '-' +
+                scored['opponent_score'].astype(int).astype(str)
+            )
+    
+    return scores.to_dict()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _player_filter_options(data_version, player_name):
+    """
+    Cached mode and map selectbox options for the player detail page.
+    TTL of 300 seconds (5 minutes).
+    """
+    df = st.session_state.df
+    player_df = df[df['player_name'] == player_name]
+    mode_options = ['All Modes'] + sorted(player_df['mode'].unique().tolist())
+    map_options = ['All Maps'] + sorted(player_df['map_name'].unique().tolist())
+    return mode_options, map_options
 
 
 def page_player_detail(player_name):
@@ -1432,12 +1672,10 @@ def page_player_detail(player_name):
     
     # Get player info
     team_name = player_df['team_name'].iloc[0]
-    from config import get_player_position
     position = get_player_position(player_name)
     
     # Load player image using cached function
-    player_images = load_player_images_cached()
-    player_image_url = player_images.get(player_name)
+    player_image_url = get_player_image_url(player_name)
     
     # Create aesthetic player header
     if player_image_url:
@@ -1498,21 +1736,20 @@ def page_player_detail(player_name):
     
     # Filters
     col1, col2, col3 = st.columns(3)
+    mode_options, map_options = _player_filter_options(st.session_state.get('data_version', 0), player_name)
     
     with col1:
-        mode_options = ['All Modes'] + sorted(player_df['mode'].unique().tolist())
         selected_mode = st.selectbox("Filter by Mode", mode_options, key="player_mode_filter")
     
     with col2:
-        map_options = ['All Maps'] + sorted(player_df['map_name'].unique().tolist())
         selected_map = st.selectbox("Filter by Map", map_options, key="player_map_filter")
     
     with col3:
         result_options = ['All Results', 'Wins Only', 'Losses Only']
         selected_result = st.selectbox("Filter by Result", result_options, key="player_result_filter")
     
-    # Apply filters
-    player_df_filtered = player_df.copy()
+    # Apply filters (boolean indexing returns new frames, so no copy is needed)
+    player_df_filtered = player_df
     
     if selected_mode != 'All Modes':
         player_df_filtered = player_df_filtered[player_df_filtered['mode'] == selected_mode]
@@ -1531,69 +1768,46 @@ def page_player_detail(player_name):
         # Sort by date (most recent first)
         player_df_sorted = player_df_filtered.sort_values(['date', 'match_id', 'map_number'], ascending=[False, False, True])
         
-        # Calculate map scores using cached function
-        df_hash = hash(str(st.session_state.df.shape) + str(st.session_state.df.columns.tolist()))
-        match_ids_tuple = tuple(player_df_sorted['match_id'].unique())
-        map_numbers_tuple = tuple(player_df_sorted['map_number'].unique())
-        map_scores = calculate_map_scores_cached(df_hash, player_name, match_ids_tuple, map_numbers_tuple)
-        
-        # Team-based color mapping (each opponent team gets a consistent color)
-        TEAM_COLORS = {
-            'Boston Breach': '#D6EAF8',          # Light blue
-            'Carolina Royal Ravens': '#FCF3CF',  # Light yellow
-            'Cloud9 New York': '#D5F4E6',        # Light green
-            'FaZe Vegas': '#FADBD8',             # Light red/pink
-            'G2 Minnesota': '#E8DAEF',           # Light purple
-            'Los Angeles Thieves': '#FAE5D3',    # Light orange
-            'Miami Heretics': '#D5DBDB',         # Light gray
-            'OpTic Texas': '#D4EFDF',            # Mint green
-            'Paris Gentle Mates': '#E3F2FD',     # Sky blue
-            'Riyadh Falcons': '#FFF9C4',         # Pale yellow
-            'Toronto KOI': '#C8E6C9',            # Pale green
-            'Vancouver Surge': '#F8BBD0',        # Pink
-        }
+        # Map scores from the cached lookup, keyed by the player's team for each map
+        all_scores = _all_map_scores(st.session_state.get('data_version', 0))
         
         # Create detailed match table with opponent-based color coding
-        match_data = []
-        row_colors = []  # Store color for each row based on opponent
-        
-        for _, row in player_df_sorted.iterrows():
-            map_key = (row['match_id'], row['map_number'])
-            
-            # Get color based on opponent team
-            opponent_color = TEAM_COLORS.get(row['opponent_team_name'], '#FFFFFF')
-            row_colors.append(opponent_color)
-            
-            match_data.append({
-                'Match ID': row['match_id'],
-                'Map Score': map_scores.get(map_key, 'N/A'),
-                'Date': row['date'].strftime('%Y-%m-%d') if pd.notna(row['date']) else 'N/A',
-                'Opponent': row['opponent_team_name'],
-                'Map': row['map_name'],
-                'Mode': row['mode'],
-                'Map #': int(row['map_number']) if pd.notna(row['map_number']) else 'N/A',
-                'Kills': int(row['kills']),
-                'Deaths': int(row['deaths']),
-                'Assists': int(row['assists']),
-                'K/D': round(row['kills'] / row['deaths'], 2) if row['deaths'] > 0 else row['kills'],
-                'Damage': int(row['damage']),
-                'Result': '✅ Win' if row['won_map'] else '❌ Loss'
-            })
+        rows = player_df_sorted
+        map_keys = zip(rows['match_id'], rows['map_number'], rows['team_name'])
+        kills = rows['kills'].to_numpy(dtype=np.float64)
+        deaths = rows['deaths'].to_numpy(dtype=np.float64)
+        has_deaths = deaths > 0
+        kd = np.where(has_deaths, np.divide(kills, deaths, out=np.zeros_like(kills), where=has_deaths).round(2), kills)
         
-        match_df = pd.DataFrame(match_data)
+        match_df = pd.DataFrame({
+            'Match ID': rows['match_id'],
+            'Map Score': [all_scores.get(map_key, 'N/A') for map_key in map_keys],
+            'Date': rows['date'].dt.strftime('%Y-%m-%d').fillna('N/A'),
+            'Opponent': rows['opponent_team_name'],
+            'Map': rows['map_name'],
+            'Mode': rows['mode'],
+            'Map #': rows['map_number'].astype('Int64').astype(object).where(rows['map_number'].notna(), 'N/A'),
+            'Kills': rows['kills'].astype(int),
+            'Deaths': rows['deaths'].astype(int),
+            'Assists': rows['assists'].astype(int),
+            'K/D': kd,
+            'Damage': rows['damage'].astype(int),
+            'Result': np.where(rows['won_map'], '✅ Win', '❌ Loss'),
+        }).reset_index(drop=True)
         
-        # Create a mapping from index to color for styling (based on opponent)
-        index_to_color = {idx: color for idx, color in enumerate(row_colors)}
-        
-        # Display with styling using Streamlit's dataframe
-        def highlight_by_opponent(row):
-            """Color each row based on the opponent team"""
-            color = index_to_color.get(row.name, '#FFFFFF')
-            return [f'background-color: {color}; color: #000000' for _ in row]
-        
-        # Drop Match ID column and apply styling
+        # Drop Match ID column and color each row based on the opponent team
         display_df = match_df.drop(columns=['Match ID'])
-        styled_df = display_df.style.apply(highlight_by_opponent, axis=1)
+        row_css = (
+            'background-color: ' +
+            rows['opponent_team_name'].astype(object).map(TEAM_COLORS).fillna('#FFFFFF').to_numpy(dtype=object) +
+            '; color: #000000'
+        )
+        css = pd.DataFrame(
+            np.tile(row_css[:, None], (1, display_df.shape[1])),
+            index=display_df.index,
+            columns=display_df.columns,
+        )
+        styled_df = display_df.style.apply(lambda _: css, axis=None)
         
         st.dataframe(
             styled_df,
@@ -1610,23 +1824,27 @@ def page_player_detail(player_name):
     mode_tabs = st.tabs(["📊 Overview", "🎯 Hardpoint", "💣 Search & Destroy", "⚡ Overload"])
     
     with mode_tabs[0]:
-        # Mode comparison
-        mode_stats = []
-        for mode in ['Hardpoint', 'Search & Destroy', 'Overload']:
-            mode_df = player_df[player_df['mode'] == mode]
-            if not mode_df.empty:
-                mode_stats.append({
-                    'Mode': mode,
-                    'Maps': len(mode_df),
-                    'Avg Kills': mode_df['kills'].mean(),
-                    'Avg Deaths': mode_df['deaths'].mean(),
-                    'K/D': mode_df['kills'].mean() / mode_df['deaths'].mean() if mode_df['deaths'].mean() > 0 else 0,
-                    'Avg Damage': mode_df['damage'].mean(),
-                    'Win %': (mode_df['won_map'].sum() / len(mode_df) * 100)
-                })
+        # Mode comparison (one aggregation pass over all modes)
+        mode_order = ['Hardpoint', 'Search & Destroy', 'Overload']
+        mode_agg = player_df[player_df['mode'].isin(mode_order)].groupby('mode', observed=True).agg(
+            maps=('kills', 'size'),
+            avg_kills=('kills', 'mean'),
+            avg_deaths=('deaths', 'mean'),
+            avg_damage=('damage', 'mean'),
+            wins=('won_map', 'sum'),
+        )
+        mode_agg = mode_agg.reindex([mode for mode in mode_order if mode in mode_agg.index])
         
-        if mode_stats:
-            mode_stats_df = pd.DataFrame(mode_stats)
+        if not mode_agg.empty:
+            mode_stats_df = pd.DataFrame({
+                'Mode': list(mode_agg.index),
+                'Maps': mode_agg['maps'].to_numpy(),
+                'Avg Kills': mode_agg['avg_kills'].to_numpy(),
+                'Avg Deaths': mode_agg['avg_deaths'].to_numpy(),
+                'K/D': np.where(mode_agg['avg_deaths'] > 0, mode_agg['avg_kills'] / mode_agg['avg_deaths'], 0),
+                'Avg Damage': mode_agg['avg_damage'].to_numpy(),
+                'Win %': (mode_agg['wins'] / mode_agg['maps'] * 100).to_numpy(),
+            })
             st.dataframe(
                 mode_stats_df.style.format({
                     'Avg Kills': '{:.1f}',
@@ -1660,16 +1878,19 @@ def page_player_detail(player_name):
             else:
                 # Performance by map
                 st.markdown(f"#### {mode} Performance by Map")
-                map_stats = mode_df.groupby('map_name').agg({
-                    'kills': 'mean',
-                    'deaths': 'mean',
-                    'damage': 'mean',
-                    'won_map': lambda x: (x.sum() / len(x) * 100)
-                }).reset_index()
+                map_stats = mode_df.groupby('map_name', observed=True).agg(
+                    maps=('kills', 'size'),
+                    avg_kills=('kills', 'mean'),
+                    avg_deaths=('deaths', 'mean'),
+                    avg_damage=('damage', 'mean'),
+                    wins=('won_map', 'sum'),
+                ).reset_index()
                 
-                map_stats.columns = ['Map', 'Avg Kills', 'Avg Deaths', 'Avg Damage', 'Win %']
-                map_stats['K/D'] = map_stats['Avg Kills'] / map_stats['Avg Deaths']
-                map_stats['Maps'] = mode_df.groupby('map_name').size().values
+                map_stats.columns = ['Map', 'Maps', 'Avg Kills', 'Avg Deaths', 'Avg Damage', 'Win %']
+                map_stats['Win %'] = map_stats['Win %'] / map_stats['Maps'] * 100
+                kills = map_stats['Avg Kills'].to_numpy()
+                deaths = map_stats['Avg Deaths'].to_numpy()
+                map_stats['K/D'] = np.divide(kills, deaths, out=np.zeros_like(kills), where=deaths > 0)
                 
                 st.dataframe(
                     map_stats[['Map', 'Maps', 'Avg Kills', 'Avg Deaths', 'K/D', 'Avg Damage', 'Win %']].style.format({
@@ -1684,6 +1905,117 @@ def page_player_detail(player_name):
                 )
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _player_mode_map_stats(data_version, team_name, won_map=None):
+    """
+    Cached per-player averages for a team, indexed by (mode, map_name, player_name).
+    won_map restricts the rows to won (True) or lost (False) maps.
+    TTL of 300 seconds (5 minutes).
+    """
+    team_df = st.session_state.df[st.session_state.df['team_name'] == team_name]
+    if won_map is not None:
+        team_df = team_df[team_df['won_map'] == won_map]
+    
+    stats = team_df.groupby(['mode', 'map_name', 'player_name'], observed=True).agg(
+        maps=('kills', 'size'),
+        avg_kills=('kills', 'mean'),
+        avg_deaths=('deaths', 'mean'),
+        avg_damage=('damage', 'mean'),
+        wins=('won_map', 'sum'),
+    )
+    stats['kd'] = np.where(stats['avg_deaths'] > 0, stats['avg_kills'] / stats['avg_deaths'], 0)
+    stats['win_pct'] = stats['wins'] / stats['maps'] * 100
+    
+    return stats[['maps', 'avg_kills', 'avg_deaths', 'kd', 'avg_damage', 'win_pct']].rename(columns={
+        'maps': 'Maps',
+        'avg_kills': 'Avg Kills',
+        'avg_deaths': 'Avg Deaths',
+        'kd': 'K/D',
+        'avg_damage': 'Avg Damage',
+        'win_pct': 'Win %',
+    })
+
+
+def _render_mode_tab(team_df, team_name, mode, key_prefix):
+    """Render one mode tab of the team dashboard: per-map records and player stats."""
+    st.markdown(f"### {mode} Analysis")
+    mode_df = team_df[team_df['mode'] == mode]
+    
+    if mode_df.empty:
+        st.info(f"No {mode} data available.")
+        return
+    
+    # Win/Loss filter
+    win_loss_filter = st.radio(
+        "Filter by Result",
+        ["All Maps", "Wins Only", "Losses Only"],
+        horizontal=True,
+        key=f"{key_prefix}_filter"
+    )
+    
+    # Apply filter
+    if win_loss_filter == "Wins Only":
+        mode_filtered = mode_df[mode_df['won_map'] == True]
+    elif win_loss_filter == "Losses Only":
+        mode_filtered = mode_df[mode_df['won_map'] == False]
+    else:
+        mode_filtered = mode_df
+    
+    mode_stats = _player_mode_map_stats(
+        st.session_state.get('data_version', 0),
+        team_name,
+        {"Wins Only": True, "Losses Only": False}.get(win_loss_filter),
+    )
+    
+    # One row per map played, partitioned once by map for the (won, lost) records
+    unique_maps = mode_filtered.drop_duplicates(['match_id', 'map_number'])[['map_name', 'won_map']]
+    map_records = {}
+    for map_name, map_games in unique_maps.groupby('map_name', sort=True, observed=True):
+        map_won = int((map_games['won_map'] == True).sum())
+        map_records[map_name] = (map_won, len(map_games) - map_won)
+    
+    maps = list(map_records)
+    if not maps:
+        return
+    
+    # Only the selected map's player stats are rendered
+    selected_map = st.selectbox(
+        "Select Map",
+        maps,
+        format_func=lambda m: f"📍 {m} ({map_records[m][0]}-{map_records[m][1]})",
+        key=f"{key_prefix}_map"
+    )
+    
+    # Player stats on this map
+    stats_df = mode_stats.loc[(mode, selected_map)].rename_axis('Player').reset_index()
+    players = stats_df['Player'].tolist()
+    
+    # Display player buttons for navigation
+    st.markdown("**Click player name to view detailed stats:**")
+    player_cols = st.columns(min(len(players), 4))
+    for idx, player in enumerate(players):
+        with player_cols[idx % 4]:
+            if st.button(f"👤 {player}", key=f"{key_prefix}_{selected_map}_{player}", use_container_width=True):
+                st.session_state.current_player = player
+                if 'current_team' in st.session_state:
+                    del st.session_state.current_team
+                st.rerun()
+    
+    st.markdown("---")
+    
+    st.dataframe(
+        stats_df.style.format({
+            'Avg Kills': '{:.1f}',
+            'Avg Deaths': '{:.1f}',
+            'K/D': '{:.2f}',
+            'Avg Damage': '{:.0f}',
+            'Win %': '{:.1f}%'
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+
+
 def page_team_detail(team_name):
     """Display detailed team dashboard with mode-specific analysis."""
     
@@ -1721,8 +2053,12 @@ def page_team_detail(team_name):
     st.markdown("### Team Overview")
     col1, col2, col3 = st.columns(3)
     
+    # One row per map played
+    map_level = get_map_level(st.session_state.get('data_version', 0))
+    team_maps = map_level[map_level['team_name'] == team_name]
+    
     with col1:
-        total_maps = len(team_df.groupby(['match_id', 'map_number']).size())
+        total_maps = len(team_maps)
         st.metric("Total Maps", total_maps)
     
     with col2:
@@ -1731,9 +2067,8 @@ def page_team_detail(team_name):
     
     with col3:
         # Calculate win rate correctly by counting unique maps won
-        unique_maps = team_df.groupby(['match_id', 'map_number'])['won_map'].first()
-        maps_won = unique_maps.sum()
-        total_unique_maps = len(unique_maps)
+        maps_won = team_maps['won_map'].sum()
+        total_unique_maps = len(team_maps)
         win_rate = (maps_won / total_unique_maps * 100) if total_unique_maps > 0 else 0
         st.metric("Map Win Rate", f"{win_rate:.1f}%")
     
@@ -1742,245 +2077,14 @@ def page_team_detail(team_name):
     # Mode tabs
     tab1, tab2, tab3 = st.tabs(["🎯 Hardpoint", "💣 Search & Destroy", "⚡ Overload"])
     
-    # ===== HARDPOINT TAB =====
     with tab1:
-        st.markdown("### Hardpoint Analysis")
-        hp_df = team_df[team_df['mode'] == 'Hardpoint']
-        
-        if hp_df.empty:
-            st.info("No Hardpoint data available.")
-        else:
-            # Win/Loss filter
-            win_loss_filter = st.radio(
-                "Filter by Result",
-                ["All Maps", "Wins Only", "Losses Only"],
-                horizontal=True,
-                key="hp_filter"
-            )
-            
-            # Apply filter
-            if win_loss_filter == "Wins Only":
-                hp_filtered = hp_df[hp_df['won_map'] == True]
-            elif win_loss_filter == "Losses Only":
-                hp_filtered = hp_df[hp_df['won_map'] == False]
-            else:
-                hp_filtered = hp_df
-            
-            # Get unique maps
-            maps = sorted(hp_filtered['map_name'].unique())
-            
-            # Display stats by map
-            for map_name in maps:
-                map_df = hp_filtered[hp_filtered['map_name'] == map_name]
-                
-                # Calculate map record
-                map_total = len(map_df.groupby(['match_id', 'map_number']).size())
-                map_won = len(map_df[map_df['won_map'] == True].groupby(['match_id', 'map_number']).size())
-                map_lost = map_total - map_won
-                
-                with st.expander(f"📍 {map_name} ({map_won}-{map_lost})"):
-                    # Player stats on this map
-                    player_stats = []
-                    players = sorted(map_df['player_name'].unique())
-                    
-                    # Display player buttons for navigation
-                    st.markdown("**Click player name to view detailed stats:**")
-                    player_cols = st.columns(min(len(players), 4))
-                    for idx, player in enumerate(players):
-                        with player_cols[idx % 4]:
-                            if st.button(f"👤 {player}", key=f"hp_{map_name}_{player}", use_container_width=True):
-                                st.session_state.current_player = player
-                                if 'current_team' in st.session_state:
-                                    del st.session_state.current_team
-                                st.rerun()
-                    
-                    st.markdown("---")
-                    
-                    for player in players:
-                        player_map_df = map_df[map_df['player_name'] == player]
-                        stats = {
-                            'Player': player,
-                            'Maps': len(player_map_df),
-                            'Avg Kills': player_map_df['kills'].mean(),
-                            'Avg Deaths': player_map_df['deaths'].mean(),
-                            'K/D': player_map_df['kills'].mean() / player_map_df['deaths'].mean() if player_map_df['deaths'].mean() > 0 else 0,
-                            'Avg Damage': player_map_df['damage'].mean(),
-                            'Win %': (player_map_df['won_map'].sum() / len(player_map_df) * 100) if len(player_map_df) > 0 else 0
-                        }
-                        player_stats.append(stats)
-                    
-                    stats_df = pd.DataFrame(player_stats)
-                    st.dataframe(
-                        stats_df.style.format({
-                            'Avg Kills': '{:.1f}',
-                            'Avg Deaths': '{:.1f}',
-                            'K/D': '{:.2f}',
-                            'Avg Damage': '{:.0f}',
-                            'Win %': '{:.1f}%'
-                        }),
-                        use_container_width=True,
-                        hide_index=True
-                    )
+        _render_mode_tab(team_df, team_name, 'Hardpoint', 'hp')
     
-    # ===== SEARCH & DESTROY TAB =====
     with tab2:
-        st.markdown("### Search & Destroy Analysis")
-        snd_df = team_df[team_df['mode'] == 'Search & Destroy']
-        
-        if snd_df.empty:
-            st.info("No Search & Destroy data available.")
-        else:
-            # Win/Loss filter
-            win_loss_filter = st.radio(
-                "Filter by Result",
-                ["All Maps", "Wins Only", "Losses Only"],
-                horizontal=True,
-                key="snd_filter"
-            )
-            
-            # Apply filter
-            if win_loss_filter == "Wins Only":
-                snd_filtered = snd_df[snd_df['won_map'] == True]
-            elif win_loss_filter == "Losses Only":
-                snd_filtered = snd_df[snd_df['won_map'] == False]
-            else:
-                snd_filtered = snd_df
-            
-            # Get unique maps
-            maps = sorted(snd_filtered['map_name'].unique())
-            
-            # Display stats by map
-            for map_name in maps:
-                map_df = snd_filtered[snd_filtered['map_name'] == map_name]
-                
-                # Calculate map record
-                map_total = len(map_df.groupby(['match_id', 'map_number']).size())
-                map_won = len(map_df[map_df['won_map'] == True].groupby(['match_id', 'map_number']).size())
-                map_lost = map_total - map_won
-                
-                with st.expander(f"📍 {map_name} ({map_won}-{map_lost})"):
-                    # Player stats on this map
-                    player_stats = []
-                    players = sorted(map_df['player_name'].unique())
-                    
-                    # Display player buttons for navigation
-                    st.markdown("**Click player name to view detailed stats:**")
-                    player_cols = st.columns(min(len(players), 4))
-                    for idx, player in enumerate(players):
-                        with player_cols[idx % 4]:
-                            if st.button(f"👤 {player}", key=f"snd_{map_name}_{player}", use_container_width=True):
-                                st.session_state.current_player = player
-                                if 'current_team' in st.session_state:
-                                    del st.session_state.current_team
-                                st.rerun()
-                    
-                    st.markdown("---")
-                    
-                    for player in players:
-                        player_map_df = map_df[map_df['player_name'] == player]
-                        stats = {
-                            'Player': player,
-                            'Maps': len(player_map_df),
-                            'Avg Kills': player_map_df['kills'].mean(),
-                            'Avg Deaths': player_map_df['deaths'].mean(),
-                            'K/D': player_map_df['kills'].mean() / player_map_df['deaths'].mean() if player_map_df['deaths'].mean() > 0 else 0,
-                            'Avg Damage': player_map_df['damage'].mean(),
-                            'Win %': (player_map_df['won_map'].sum() / len(player_map_df) * 100) if len(player_map_df) > 0 else 0
-                        }
-                        player_stats.append(stats)
-                    
-                    stats_df = pd.DataFrame(player_stats)
-                    st.dataframe(
-                        stats_df.style.format({
-                            'Avg Kills': '{:.1f}',
-                            'Avg Deaths': '{:.1f}',
-                            'K/D': '{:.2f}',
-                            'Avg Damage': '{:.0f}',
-                            'Win %': '{:.1f}%'
-                        }),
-                        use_container_width=True,
-                        hide_index=True
-                    )
+        _render_mode_tab(team_df, team_name, 'Search & Destroy', 'snd')
     
-    # ===== OVERLOAD TAB =====
     with tab3:
-        st.markdown("### Overload Analysis")
-        overload_df = team_df[team_df['mode'] == 'Overload']
-        
-        if overload_df.empty:
-            st.info("No Overload data available.")
-        else:
-            # Win/Loss filter
-            win_loss_filter = st.radio(
-                "Filter by Result",
-                ["All Maps", "Wins Only", "Losses Only"],
-                horizontal=True,
-                key="overload_filter"
-            )
-            
-            # Apply filter
-            if win_loss_filter == "Wins Only":
-                overload_filtered = overload_df[overload_df['won_map'] == True]
-            elif win_loss_filter == "Losses Only":
-                overload_filtered = overload_df[overload_df['won_map'] == False]
-            else:
-                overload_filtered = overload_df
-            
-            # Get unique maps
-            maps = sorted(overload_filtered['map_name'].unique())
-            
-            # Display stats by map
-            for map_name in maps:
-                map_df = overload_filtered[overload_filtered['map_name'] == map_name]
-                
-                # Calculate map record
-                map_total = len(map_df.groupby(['match_id', 'map_number']).size())
-                map_won = len(map_df[map_df['won_map'] == True].groupby(['match_id', 'map_number']).size())
-                map_lost = map_total - map_won
-                
-                with st.expander(f"📍 {map_name} ({map_won}-{map_lost})"):
-                    # Player stats on this map
-                    player_stats = []
-                    players = sorted(map_df['player_name'].unique())
-                    
-                    # Display player buttons for navigation
-                    st.markdown("**Click player name to view detailed stats:**")
-                    player_cols = st.columns(min(len(players), 4))
-                    for idx, player in enumerate(players):
-                        with player_cols[idx % 4]:
-                            if st.button(f"👤 {player}", key=f"overload_{map_name}_{player}", use_container_width=True):
-                                st.session_state.current_player = player
-                                if 'current_team' in st.session_state:
-                                    del st.session_state.current_team
-                                st.rerun()
-                    
-                    st.markdown("---")
-                    
-                    for player in players:
-                        player_map_df = map_df[map_df['player_name'] == player]
-                        stats = {
-                            'Player': player,
-                            'Maps': len(player_map_df),
-                            'Avg Kills': player_map_df['kills'].mean(),
-                            'Avg Deaths': player_map_df['deaths'].mean(),
-                            'K/D': player_map_df['kills'].mean() / player_map_df['deaths'].mean() if player_map_df['deaths'].mean() > 0 else 0,
-                            'Avg Damage': player_map_df['damage'].mean(),
-                            'Win %': (player_map_df['won_map'].sum() / len(player_map_df) * 100) if len(player_map_df) > 0 else 0
-                        }
-                        player_stats.append(stats)
-                    
-                    stats_df = pd.DataFrame(player_stats)
-                    st.dataframe(
-                        stats_df.style.format({
-                            'Avg Kills': '{:.1f}',
-                            'Avg Deaths': '{:.1f}',
-                            'K/D': '{:.2f}',
-                            'Avg Damage': '{:.0f}',
-                            'Win %': '{:.1f}%'
-                        }),
-                        use_container_width=True,
-                        hide_index=True
-                    )
+        _render_mode_tab(team_df, team_name, 'Overload', 'overload')
 
 
 # ============================================================================
@@ -1988,36 +2092,42 @@ def page_team_detail(team_name):
 # ============================================================================
 
 @st.cache_data(ttl=300, show_spinner=False)
-def calculate_team_records_cached(df_hash, team_name):
+def calculate_team_records_cached(data_version, team_name):
     """
     Cached calculation of team records to avoid recomputing on each render.
+    data_version is st.session_state['data_version'], the content fingerprint
+    of the loaded dataframe, so sessions share records only for identical data.
     TTL of 300 seconds (5 minutes).
     """
-    team_df = st.session_state.df[st.session_state.df['team_name'] == team_name]
+    # One row per map played
+    map_level = get_map_level(data_version)
+    unique_maps = map_level[map_level['team_name'] == team_name]
+    won = unique_maps['won_map'] == True
     
-    # Calculate series record
-    matches = team_df.groupby('match_id')
-    series_wins = sum(match['won_map'].iloc[0] for _, match in matches if not match.empty)
-    series_losses = len(matches) - series_wins
+    # Calculate series record: a series is won by winning more than half its maps
+    series_counts = won.groupby(unique_maps['match_id'], observed=True).agg(['sum', 'size'])
+    series_wins = int((series_counts['sum'] * 2 > series_counts['size']).sum())
+    series_losses = len(series_counts) - series_wins
     
     # Calculate mode-specific map records
     records = {'series_wins': series_wins, 'series_losses': series_losses}
+    mode_counts = won.groupby(unique_maps['mode'], sort=False, observed=True).agg(['sum', 'size'])
     
     for mode_name, mode_label in [('Hardpoint', 'hp'), ('Search & Destroy', 'snd'), ('Overload', 'overload')]:
-        mode_df = team_df[team_df['mode'] == mode_name]
-        total = len(mode_df.groupby(['match_id', 'map_number']).size()) if not mode_df.empty else 0
-        won = len(mode_df[mode_df['won_map'] == True].groupby(['match_id', 'map_number']).size()) if not mode_df.empty else 0
+        total = int(mode_counts.loc[mode_name, 'size']) if mode_name in mode_counts.index else 0
+        won_count = int(mode_counts.loc[mode_name, 'sum']) if mode_name in mode_counts.index else 0
         records[f'{mode_label}_total'] = total
-        records[f'{mode_label}_won'] = won
-        records[f'{mode_label}_lost'] = total - won
+        records[f'{mode_label}_won'] = won_count
+        records[f'{mode_label}_lost'] = total - won_count
     
     return records
 
 
 @st.cache_data(ttl=300, show_spinner=False)
-def calculate_player_stats_cached(df_hash, player_name, team_name, filter_type):
+def calculate_player_stats_cached(data_version, player_name, team_name, filter_type):
     """
     Cached calculation of player statistics to avoid recomputing.
+    data_version: st.session_state['data_version'], fingerprint of the loaded dataframe
     filter_type: 'all', 'wins', or 'losses'
     TTL of 300 seconds (5 minutes).
     """
@@ -2033,21 +2143,44 @@ def calculate_player_stats_cached(df_hash, player_name, team_name, filter_type):
     if player_data.empty:
         return None
     
-    # Calculate stats by mode
+    # Calculate stats by mode in a single grouped pass
+    mode_means = player_data.groupby('mode', sort=False, observed=True)[['kills', 'deaths', 'damage']].mean()
     stats = {}
     for mode in ['Hardpoint', 'Search & Destroy', 'Overload']:
-        mode_data = player_data[player_data['mode'] == mode]
-        if not mode_data.empty:
+        if mode in mode_means.index:
+            kills, deaths, damage = mode_means.loc[mode].to_numpy()
+            kd = np.divide(kills, deaths, out=np.zeros(()), where=deaths > 0)
             stats[mode] = {
-                'kills': round(mode_data['kills'].mean(), 1),
-                'deaths': round(mode_data['deaths'].mean(), 1),
-                'kd': round(mode_data['kills'].mean() / mode_data['deaths'].mean(), 2) if mode_data['deaths'].mean() > 0 else 0,
-                'damage': round(mode_data['damage'].mean(), 0)
+                'kills': round(kills, 1),
+                'deaths': round(deaths, 1),
+                'kd': round(float(kd), 2),
+                'damage': round(damage, 0)
             }
     
     return stats
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def team_player_mode_kills(data_version, team_name, filter_option):
+    """
+    Cached average kills per player and mode for a team, as a player x mode frame.
+    filter_option: 'All Maps', 'Wins Only', or 'Losses Only'
+    TTL of 300 seconds (5 minutes).
+    """
+    df = st.session_state.df
+    team_df = df[df['team_name'] == team_name]
+    
+    if filter_option == "Wins Only":
+        team_df = team_df[team_df['won_map'] == True]
+    elif filter_option == "Losses Only":
+        team_df = team_df[team_df['won_map'] == False]
+    
+    return team_df.pivot_table(
+        values='kills', index='player_name', columns='mode', aggfunc='mean', fill_value=0.0,
+        observed=True, sort=False
+    ).reindex(columns=['Hardpoint', 'Search & Destroy', 'Overload'], fill_value=0.0)
+
+
 def page_player_overview():
     """Display team-organized player statistics across all game modes."""
     st.markdown('<div class="title-section"><h2>👤 Player Overview</h2></div>', 
@@ -2078,57 +2211,16 @@ def page_player_overview():
     # Get unique teams
     teams = sorted(maps_df['team_name'].unique())
     
-    # Create team player mapping from config
-    team_player_map = {
-        'Boston Breach': ['Cammy', 'Snoopy', 'Purj', 'Nastie'],
-        'Carolina Royal Ravens': ['SlasheR', 'Nero', 'Lurqxx', 'Craze'],
-        'Cloud9 New York': ['Mack', 'Afro', 'Beans', 'Vivid'],
-        'FaZe Vegas': ['Drazah', 'Abuzah', '04', 'Simp'],
-        'G2 Minnesota': ['Skyz', 'Estreal', 'Kremp', 'Mamba'],
-        'Los Angeles Thieves': ['aBeZy', 'HyDra', 'Scrap', 'Kenny'],
-        'Miami Heretics': ['MettalZ', 'Traixx', 'SupeR', 'RenKoR'],
-        'OpTic Texas': ['Shotzzy', 'Dashy', 'Huke', 'Mercules'],
-        'Paris Gentle Mates': ['Envoy', 'Ghosty', 'Neptune', 'Sib'],
-        'Riyadh Falcons': ['Cellium', 'Pred', 'Exnid', 'KiSMET'],
-        'Toronto KOI': ['ReeaL', 'CleanX', 'JoeDeceives', 'Insight'],
-        'Vancouver Surge': ['Abe', 'Gwinn', 'Lunarz', 'Lqgend'],
-    }
+    data_version = st.session_state.get('data_version', 0)
     
     # Display each team
     for team in teams:
-        team_df = maps_df[maps_df['team_name'] == team]
-        
-        # Calculate series/match record (wins/losses of BO5 series)
-        # Group by match_id and count maps won per series
-        match_results = team_df.groupby('match_id').agg({
-            'won_map': lambda x: x.sum(),  # Count maps won in this series
-            'map_number': 'count'  # Total maps played
-        }).reset_index()
-        
-        # A team wins the series if they won more than half the maps
-        match_results['series_won'] = match_results['won_map'] > (match_results['map_number'] / 2)
-        series_wins = match_results['series_won'].sum()
-        total_series = len(match_results)
-        series_losses = total_series - series_wins
-        
-        # Calculate mode-specific map records (individual map wins/losses)
-        # Hardpoint
-        hp_df = team_df[team_df['mode'] == 'Hardpoint']
-        hp_total = len(hp_df.groupby(['match_id', 'map_number']).size()) if not hp_df.empty else 0
-        hp_won = len(hp_df[hp_df['won_map'] == True].groupby(['match_id', 'map_number']).size()) if not hp_df.empty else 0
-        hp_lost = hp_total - hp_won
-        
-        # Search & Destroy
-        snd_df = team_df[team_df['mode'] == 'Search & Destroy']
-        snd_total = len(snd_df.groupby(['match_id', 'map_number']).size()) if not snd_df.empty else 0
-        snd_won = len(snd_df[snd_df['won_map'] == True].groupby(['match_id', 'map_number']).size()) if not snd_df.empty else 0
-        snd_lost = snd_total - snd_won
-        
-        # Overload
-        overload_df = team_df[team_df['mode'] == 'Overload']
-        overload_total = len(overload_df.groupby(['match_id', 'map_number']).size()) if not overload_df.empty else 0
-        overload_won = len(overload_df[overload_df['won_map'] == True].groupby(['match_id', 'map_number']).size()) if not overload_df.empty else 0
-        overload_lost = overload_total - overload_won
+        # Series record and mode-specific map records (cached per team)
+        records = calculate_team_records_cached(data_version, team)
+        series_wins, series_losses = records['series_wins'], records['series_losses']
+        hp_won, hp_lost = records['hp_won'], records['hp_lost']
+        snd_won, snd_lost = records['snd_won'], records['snd_lost']
+        overload_won, overload_lost = records['overload_won'], records['overload_lost']
         
         # Team header with records and filter toggle
         col_header, col_button = st.columns([4, 1])
@@ -2151,31 +2243,21 @@ def page_player_overview():
             key=f"{team}_filter"
         )
         
-        # Filter data based on selection
-        if filter_option == "Wins Only":
-            team_df_filtered = team_df[team_df['won_map'] == True]
-            filter_label = " (Wins Only)"
-        elif filter_option == "Losses Only":
-            team_df_filtered = team_df[team_df['won_map'] == False]
-            filter_label = " (Losses Only)"
-        else:  # All Maps
-            team_df_filtered = team_df
-            filter_label = ""
+        # Average kills per player and mode for the selected maps (cached per filter)
+        kills_by_mode = team_player_mode_kills(data_version, team, filter_option)
         
         # Get players for this team (from roster or from data)
-        if team in team_player_map:
-            players = team_player_map[team]
+        if team in TEAM_PLAYER_MAP:
+            players = TEAM_PLAYER_MAP[team]
         else:
-            players = sorted(team_df_filtered['player_name'].unique())
+            players = sorted(kills_by_mode.index)
         
         # Create columns for each player (max 4 per row)
         cols = st.columns(4)
         
         for idx, player in enumerate(players):
             # Use filtered data based on win/loss toggle
-            player_data = team_df_filtered[team_df_filtered['player_name'] == player]
-            
-            if player_data.empty:
+            if player not in kills_by_mode.index:
                 continue
             
             with cols[idx % 4]:
@@ -2189,21 +2271,10 @@ def page_player_overview():
                     st.markdown(f"<div style='text-align: center;'><strong>{player}</strong></div>", unsafe_allow_html=True)
                 
                 # Get player position from config
-                from config import get_player_position
                 player_position = get_player_position(player)
                 
-                # Calculate stats using ALL available data for each mode
-                # Hardpoint (Maps 1 & 4)
-                hp_data = player_data[player_data['mode'] == 'Hardpoint']
-                avg_kills_hp = hp_data['kills'].mean() if not hp_data.empty else 0
-                
-                # Search & Destroy (Maps 2 & 5)
-                snd_data = player_data[player_data['mode'] == 'Search & Destroy']
-                avg_kills_snd = snd_data['kills'].mean() if not snd_data.empty else 0
-                
-                # Overload (Map 3)
-                overload_data = player_data[player_data['mode'] == 'Overload']
-                avg_kills_overload = overload_data['kills'].mean() if not overload_data.empty else 0
+                # Hardpoint (Maps 1 & 4), Search & Destroy (Maps 2 & 5), Overload (Map 3)
+                avg_kills_hp, avg_kills_snd, avg_kills_overload = kills_by_mode.loc[player]
                 
                 # Sum of mode averages (using all available data)
                 avg_kills_total = avg_kills_hp + avg_kills_snd + avg_kills_overload
@@ -2226,6 +2297,55 @@ def page_player_overview():
 # PAGE 3: PER-MAP/MODE BREAKDOWN
 # ============================================================================
 
+@st.cache_data(ttl=300, show_spinner=False)
+def compute_map_stats(data_version, seasons, events, lan_options, positions, modes, result_filter):
+    """
+    Cached summary and per-map averages for the Map/Mode Breakdown page.
+    Returns (total_maps, means, map_stats), or None when no rows match the filters.
+    TTL of 300 seconds (5 minutes).
+    """
+    filtered_df = get_filtered_data_cached(data_version, seasons, events, lan_options)
+    
+    # Filter data by selected positions, modes and result with one combined mask
+    mask = filtered_df['position'].isin(positions).values
+    mask &= filtered_df['mode'].isin(modes).values
+    
+    # Apply Win/Loss filter
+    if result_filter == "Win":
+        mask &= (filtered_df['won_map'] == True).values
+    elif result_filter == "Loss":
+        mask &= (filtered_df['won_map'] == False).values
+    # If "All", no additional filtering needed
+    
+    analysis_df = filtered_df.iloc[np.flatnonzero(mask)]
+    
+    if analysis_df.empty:
+        return None
+    
+    means = analysis_df[['kills', 'deaths', 'damage']].mean()
+    
+    # Group by map only - combining all selected positions
+    map_stats = analysis_df.assign(won=analysis_df['won_map'] == True).groupby('map_name', observed=True).agg({
+        'kills': 'mean',
+        'deaths': 'mean',
+        'damage': 'mean',
+        'rating': 'mean',
+        'won': 'mean'
+    })
+    # Series played per map: one dedup of (map, match) pairs instead of a per-group nunique
+    maps_played = analysis_df.drop_duplicates(['map_name', 'match_id']).groupby('map_name', observed=True).size()
+    map_stats.insert(4, 'maps_played', maps_played)
+    map_stats = map_stats.reset_index()
+    
+    map_stats.columns = ['Map', 'Avg Kills', 'Avg Deaths', 'Avg Damage', 'Avg Rating', 'Maps Played', 'Win %']
+    map_stats['Win %'] *= 100
+    kills = map_stats['Avg Kills'].to_numpy()
+    deaths = map_stats['Avg Deaths'].to_numpy()
+    map_stats['K/D'] = np.divide(kills, deaths, out=np.zeros_like(kills), where=deaths > 0)
+    
+    return len(analysis_df), means, map_stats
+
+
 def page_map_mode_breakdown():
     """Display aggregated map and mode statistics by position."""
     st.markdown('<div class="title-section"><h2>🗺️ Per-Map / Per-Mode Breakdown</h2></div>', 
@@ -2236,7 +2356,7 @@ def page_map_mode_breakdown():
     filter_col1, filter_col2, filter_col3 = st.columns(3)
     
     with filter_col1:
-        seasons = sorted(st.session_state.df['season'].unique())
+        seasons = _unique_sorted(st.session_state.get('data_version', 0), 'season')
         selected_seasons = st.multiselect(
             "Seasons",
             seasons,
@@ -2245,7 +2365,7 @@ def page_map_mode_breakdown():
         )
     
     with filter_col2:
-        events = sorted(st.session_state.df['event_name'].unique())
+        events = _unique_sorted(st.session_state.get('data_version', 0), 'event_name')
         selected_events = st.multiselect(
             "Events",
             events,
@@ -2315,55 +2435,41 @@ def page_map_mode_breakdown():
         st.warning("Please select at least one game mode.")
         return
     
-    # Filter data by selected positions and modes
-    analysis_df = filtered_df[
-        (filtered_df['position'].isin(selected_positions)) &
-        (filtered_df['mode'].isin(selected_modes))
-    ]
-    
-    # Apply Win/Loss filter
-    if result_filter == "Win":
-        analysis_df = analysis_df[analysis_df['won_map'] == True]
-    elif result_filter == "Loss":
-        analysis_df = analysis_df[analysis_df['won_map'] == False]
-    # If "All", no additional filtering needed
+    result = compute_map_stats(
+        st.session_state.get('data_version', 0),
+        tuple(sorted(selected_seasons)),
+        tuple(sorted(selected_events)),
+        tuple(sorted(lan_options)),
+        tuple(sorted(selected_positions)),
+        tuple(sorted(selected_modes)),
+        result_filter,
+    )
     
-    if analysis_df.empty:
+    if result is None:
         st.info("No data available for selected filters.")
         return
     
+    total_maps, means, map_stats = result
+    
     # Display summary metrics
     st.markdown("### 📊 Overall Averages")
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Total Maps", len(analysis_df))
+        st.metric("Total Maps", total_maps)
     with col2:
-        st.metric("Avg Kills", f"{analysis_df['kills'].mean():.2f}")
+        st.metric("Avg Kills", f"{means['kills']:.2f}")
     with col3:
-        st.metric("Avg Deaths", f"{analysis_df['deaths'].mean():.2f}")
+        st.metric("Avg Deaths", f"{means['deaths']:.2f}")
     with col4:
-        avg_kd = analysis_df['kills'].mean() / analysis_df['deaths'].mean() if analysis_df['deaths'].mean() > 0 else 0
+        avg_kd = means['kills'] / means['deaths'] if means['deaths'] > 0 else 0
         st.metric("Avg K/D", f"{avg_kd:.2f}")
     with col5:
-        st.metric("Avg Damage", f"{analysis_df['damage'].mean():.0f}")
+        st.metric("Avg Damage", f"{means['damage']:.0f}")
     
     # Average kills by map (aggregated across selected positions)
     st.markdown("### 🗺️ Average Kills by Map")
     
-    # Group by map only - combining all selected positions
-    map_stats = analysis_df.groupby('map_name').agg({
-        'kills': 'mean',
-        'deaths': 'mean',
-        'damage': 'mean',
-        'rating': 'mean',
-        'match_id': 'nunique',
-        'won_map': lambda x: (x == True).sum() / len(x) * 100 if len(x) > 0 else 0
-    }).reset_index()
-    
-    map_stats.columns = ['Map', 'Avg Kills', 'Avg Deaths', 'Avg Damage', 'Avg Rating', 'Maps Played', 'Win %']
-    map_stats['K/D'] = map_stats['Avg Kills'] / map_stats['Avg Deaths'].replace(0, 1)
-    
     # Display selected positions info
     positions_text = ", ".join(selected_positions)
     result_text = f" ({result_filter}s only)" if result_filter != "All" else " (All matches)"
@@ -2439,50 +2545,149 @@ def page_map_mode_breakdown():
 # PAGE 5: MATCHES - Detailed Match Breakdown
 # ============================================================================
 
+def _map_player_stats(team_map_stats):
+    """Per-player stats table for one team on one map (rows in data order)."""
+    return pd.DataFrame({
+        'Player': team_map_stats['player_name'].astype(object),
+        'Kills': team_map_stats['kills'].astype(int),
+        'Deaths': team_map_stats['deaths'].astype(int),
+        'Assists': team_map_stats['assists'].astype(int),
+        'Damage': team_map_stats['damage'].fillna(0).astype(int),
+        'K/D': (team_map_stats['kills'] / team_map_stats['deaths'].clip(lower=1)).round(2),
+        'Rating': team_map_stats['rating'].round(2),
+    })
+
+
+def _team_bar(df, y, title, team_colors, height=350):
+    """Bar chart comparing the two teams of a match on one column."""
+    fig = px.bar(df, x='Team', y=y, color='Team', color_discrete_map=team_colors, title=title)
+    return fig.update_layout(height=height, showlegend=False)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_matches_list(data_version):
+    """
+    Cached one-row-per-match summary for the Matches page, most recent first.
+    Returns an empty DataFrame when no match has two teams.
+    TTL of 300 seconds (5 minutes).
+    """
+    df = st.session_state.df
+    
+    # Get unique matches with team info: metadata from each match's first row,
+    # the first two teams in order of appearance, and distinct maps won per team
+    match_rows = df.drop_duplicates('match_id')
+    team_rows = df.drop_duplicates(['match_id', 'team_name'])
+    team_order = team_rows.groupby('match_id', sort=False).cumcount().to_numpy()
+    team1 = team_rows[team_order == 0].set_index('match_id')['team_name']
+    team2 = team_rows[team_order == 1].set_index('match_id')['team_name']
+    
+    # Skip matches with fewer than two teams
+    match_rows = match_rows[match_rows['match_id'].isin(team2.index)]
+    
+    if match_rows.empty:
+        return pd.DataFrame()
+    
+    map_wins = (
+        df[df['won_map'] == True]
+        .drop_duplicates(['match_id', 'team_name', 'map_number'])
+        .groupby(['match_id', 'team_name'], sort=False, observed=True)
+        .size()
+    )
+    match_ids = match_rows['match_id'].to_numpy()
+    team1_names = team1.reindex(match_ids).to_numpy()
+    team2_names = team2.reindex(match_ids).to_numpy()
+    
+    matches_list = pd.DataFrame({
+        'match_id': match_ids,
+        'date': match_rows['date'].to_numpy(),
+        'event_name': match_rows['event_name'].to_numpy(),
+        'series_type': match_rows['series_type'].to_numpy(),
+        'is_lan': match_rows['is_lan'].to_numpy(),
+        'team1': team1_names,
+        'team2': team2_names,
+        'team1_wins': map_wins.reindex(pd.MultiIndex.from_arrays([match_ids, team1_names]), fill_value=0).to_numpy(),
+        'team2_wins': map_wins.reindex(pd.MultiIndex.from_arrays([match_ids, team2_names]), fill_value=0).to_numpy(),
+    })
+    
+    # Sort by date - most recent first
+    return matches_list.sort_values('date', ascending=False, kind='stable').reset_index(drop=True)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def match_detail_bundle(data_version, match_id):
+    """
+    Cached data for one match's detail view: the match rows, header metadata,
+    and each team's player totals (most kills first) for the top performer tables.
+    Returns None if the match has no rows.
+    TTL of 300 seconds (5 minutes).
+    """
+    df = st.session_state.df
+    match_data = df[df['match_id'] == match_id]
+    
+    if match_data.empty:
+        return None
+    
+    # Determine teams - only show each team once
+    teams_in_match = sorted(match_data['team_name'].unique())
+    team1 = teams_in_match[0]
+    team2 = teams_in_match[1] if len(teams_in_match) > 1 else teams_in_match[0]
+    
+    # Distinct maps won per team
+    map_wins = match_data[match_data['won_map'] == True].groupby('team_name', sort=False, observed=True)['map_number'].nunique()
+    
+    # Per-team sums and means shared by the Overview tab and the Series Overview section
+    team_stats = match_data.groupby('team_name', sort=False, observed=True).agg(
+        kills_sum=('kills', 'sum'),
+        kills_mean=('kills', 'mean'),
+        deaths_sum=('deaths', 'sum'),
+        deaths_mean=('deaths', 'mean'),
+        assists_mean=('assists', 'mean'),
+        damage_sum=('damage', 'sum'),
+        damage_mean=('damage', 'mean'),
+        rating_mean=('rating', 'mean'),
+    )
+    team_stats = team_stats.loc[[team for team in (team1, team2) if team in team_stats.index]]
+    
+    player_totals = match_data.groupby(['team_name', 'player_name'], observed=True).agg({
+        'kills': 'sum',
+        'deaths': 'sum',
+        'rating': 'mean',
+    })
+    
+    top_players = {}
+    for team in (team1, team2):
+        players = player_totals.xs(team, level='team_name').reset_index()
+        players.columns = ['Player', 'Total Kills', 'Total Deaths', 'Avg Rating']
+        players['K/D'] = (players['Total Kills'] / players['Total Deaths'].clip(lower=1)).round(2)
+        top_players[team] = players.sort_values('Total Kills', ascending=False)
+    
+    return {
+        'match_data': match_data,
+        'date': match_data['date'].iloc[0],
+        'event_name': match_data['event_name'].iloc[0],
+        'series_type': match_data['series_type'].iloc[0],
+        'is_lan': match_data['is_lan'].iloc[0],
+        'team1': team1,
+        'team2': team2,
+        'team1_wins': int(map_wins.get(team1, 0)),
+        'team2_wins': int(map_wins.get(team2, 0)),
+        'maps_in_match': sorted(match_data['map_number'].unique()),
+        'team_stats': team_stats,
+        'top_players': top_players,
+    }
+
+
 def page_matches():
     """Display all matches in a table, with drill-down to detailed view."""
     st.markdown('<div class="title-section"><h2>🏆 Matches</h2></div>', 
                 unsafe_allow_html=True)
     
-    filtered_df = render_sidebar_filters()
-    
-    # Get unique matches with team info
-    matches_data = []
-    for match_id in filtered_df['match_id'].unique():
-        match_df = filtered_df[filtered_df['match_id'] == match_id]
-        
-        # Get the two teams
-        teams = match_df['team_name'].unique()
-        if len(teams) < 2:
-            continue
-            
-        team1 = teams[0]
-        team2 = teams[1]
-        
-        # Calculate wins per team
-        team1_wins = len(match_df[(match_df['team_name'] == team1) & (match_df['won_map'] == True)]['map_number'].unique())
-        team2_wins = len(match_df[(match_df['team_name'] == team2) & (match_df['won_map'] == True)]['map_number'].unique())
-        
-        matches_data.append({
-            'match_id': match_id,
-            'date': match_df['date'].iloc[0],
-            'event_name': match_df['event_name'].iloc[0],
-            'series_type': match_df['series_type'].iloc[0],
-            'is_lan': match_df['is_lan'].iloc[0],
-            'team1': team1,
-            'team2': team2,
-            'team1_wins': team1_wins,
-            'team2_wins': team2_wins,
-        })
+    matches_list = build_matches_list(st.session_state.get('data_version', 0))
     
-    if len(matches_data) == 0:
+    if matches_list.empty:
         st.warning("No matches available for selected filters.")
         return
     
-    matches_list = pd.DataFrame(matches_data)
-    # Sort by date - most recent first
-    matches_list = matches_list.sort_values('date', ascending=False).reset_index(drop=True)
-    
     # Initialize session state for selected match
     if 'selected_match_id' not in st.session_state:
         st.session_state.selected_match_id = None
@@ -2492,6 +2697,7 @@ def page_matches():
         # Add back button
         if st.button("← Back to Matches List"):
             st.session_state.selected_match_id = None
+            st.session_state.pop("matches_table", None)
             st.rerun()
         
         st.markdown("---")
@@ -2499,36 +2705,32 @@ def page_matches():
         selected_match_id = st.session_state.selected_match_id
         
         # Get all data for this match
-        match_data = filtered_df[filtered_df['match_id'] == selected_match_id].copy()
+        bundle = match_detail_bundle(st.session_state.get('data_version', 0), selected_match_id)
         
-        if len(match_data) == 0:
+        if bundle is None:
             st.error("No data available for this match.")
             return
         
-        # Extract match metadata
-        match_date = match_data['date'].iloc[0]
-        event_name = match_data['event_name'].iloc[0]
-        series_type = match_data['series_type'].iloc[0]
-        is_lan = match_data['is_lan'].iloc[0]
-        
-        # Determine teams - only show each team once
-        teams_in_match = sorted(match_data['team_name'].unique())
-        team1 = teams_in_match[0]
-        team2 = teams_in_match[1] if len(teams_in_match) > 1 else teams_in_match[0]
-        
-        # Calculate wins per team
-        team1_wins = len(match_data[(match_data['team_name'] == team1) & (match_data['won_map'] == True)]['map_number'].unique())
-        team2_wins = len(match_data[(match_data['team_name'] == team2) & (match_data['won_map'] == True)]['map_number'].unique())
+        match_data = bundle['match_data']
+        match_date = bundle['date']
+        event_name = bundle['event_name']
+        series_type = bundle['series_type']
+        is_lan = bundle['is_lan']
+        team1 = bundle['team1']
+        team2 = bundle['team2']
+        team1_wins = bundle['team1_wins']
+        team2_wins = bundle['team2_wins']
+        team_colors = {team1: '#1f77b4', team2: '#ff7f0e'}
         
         # ========== MATCH HEADER WITH LOGOS ==========
         col1, col2, col3 = st.columns([1.5, 1, 1.5])
         
         # Team 1
         with col1:
-            try:
-                logo_path1 = f'data/team_logos/{team1.replace(" ", "_").lower()}.png'
+            logo_path1 = load_image_index('data/team_logos').get(team1.replace(" ", "_").lower())
+            if logo_path1:
                 st.image(logo_path1, width=100, use_column_width=False)
-            except:
+            else:
                 st.info("📷 Logo")
             st.markdown(f"## {team1}")
             st.metric("Maps Won", team1_wins)
@@ -2544,10 +2746,10 @@ def page_matches():
         
         # Team 2
         with col3:
-            try:
-                logo_path2 = f'data/team_logos/{team2.replace(" ", "_").lower()}.png'
+            logo_path2 = load_image_index('data/team_logos').get(team2.replace(" ", "_").lower())
+            if logo_path2:
                 st.image(logo_path2, width=100, use_column_width=False)
-            except:
+            else:
                 st.info("📷 Logo")
             st.markdown(f"## {team2}")
             st.metric("Maps Won", team2_wins)
@@ -2556,15 +2758,22 @@ def page_matches():
         st.divider()
         
         # ========== TABS: OVERVIEW + MAP BREAKDOWN ==========
-        maps_in_match = sorted(match_data['map_number'].unique())
+        maps_in_match = bundle['maps_in_match']
         
         if len(maps_in_match) > 0:
             # Create tab labels with Overview first
             tab_labels = ["📊 Overview"] + [f"Map {int(m)}" for m in maps_in_match]
-            map_tabs = st.tabs(tab_labels)
+            # Only the selected tab is built on each rerun (st.tabs renders every tab body)
+            active_tab = st.radio(
+                "Map",
+                tab_labels,
+                horizontal=True,
+                label_visibility='collapsed',
+                key=f"map_tab_{selected_match_id}",
+            )
             
             # ========== OVERVIEW TAB ==========
-            with map_tabs[0]:
+            if active_tab == tab_labels[0]:
                 st.markdown("## Series Overview")
                 
                 # Series stats
@@ -2583,29 +2792,17 @@ def page_matches():
                 # Team comparison across all maps
                 st.markdown("### Team Stats (All Maps)")
                 
-                team_overview_stats = []
-                for team in [team1, team2]:
-                    team_data = match_data[match_data['team_name'] == team]
-                    if len(team_data) > 0:
-                        team_stats = team_data.agg({
-                            'kills': ['sum', 'mean'],
-                            'deaths': ['sum', 'mean'],
-                            'assists': ['sum', 'mean'],
-                            'damage': ['sum', 'mean'],
-                            'rating': 'mean',
-                        })
-                        team_overview_stats.append({
-                            'Team': team,
-                            'Total Kills': int(team_stats['kills']['sum']),
-                            'Avg Kills': round(team_stats['kills']['mean'], 2),
-                            'Total Deaths': int(team_stats['deaths']['sum']),
-                            'Avg Deaths': round(team_stats['deaths']['mean'], 2),
-                            'Avg K/D': round(team_stats['kills']['mean'] / max(team_stats['deaths']['mean'], 1), 2),
-                            'Total Damage': int(team_stats['damage']['sum']),
-                            'Avg Rating': round(team_stats['rating'], 2),
-                        })
-                
-                comparison_df = pd.DataFrame(team_overview_stats)
+                team_stats = bundle['team_stats']
+                comparison_df = pd.DataFrame({
+                    'Team': list(team_stats.index),
+                    'Total Kills': team_stats['kills_sum'].astype(int).to_numpy(),
+                    'Avg Kills': team_stats['kills_mean'].round(2).to_numpy(),
+                    'Total Deaths': team_stats['deaths_sum'].astype(int).to_numpy(),
+                    'Avg Deaths': team_stats['deaths_mean'].round(2).to_numpy(),
+                    'Avg K/D': (team_stats['kills_mean'] / team_stats['deaths_mean'].clip(lower=1)).round(2).to_numpy(),
+                    'Total Damage': team_stats['damage_sum'].astype(int).to_numpy(),
+                    'Avg Rating': team_stats['rating_mean'].round(2).to_numpy(),
+                })
                 st.dataframe(
                     comparison_df,
                     use_container_width=True,
@@ -2626,27 +2823,11 @@ def page_matches():
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    fig_kills = px.bar(
-                        comparison_df,
-                        x='Team',
-                        y='Total Kills',
-                        color='Team',
-                        color_discrete_map={team1: '#1f77b4', team2: '#ff7f0e'},
-                        title="Total Kills (Series)",
-                    )
-                    fig_kills.update_layout(height=350, showlegend=False)
+                    fig_kills = _team_bar(comparison_df, 'Total Kills', "Total Kills (Series)", team_colors)
                     st.plotly_chart(fig_kills, use_container_width=True)
                 
                 with col2:
-                    fig_rating = px.bar(
-                        comparison_df,
-                        x='Team',
-                        y='Avg Rating',
-                        color='Team',
-                        color_discrete_map={team1: '#1f77b4', team2: '#ff7f0e'},
-                        title="Avg Rating (Series)",
-                    )
-                    fig_rating.update_layout(height=350, showlegend=False)
+                    fig_rating = _team_bar(comparison_df, 'Avg Rating', "Avg Rating (Series)", team_colors)
                     st.plotly_chart(fig_rating, use_container_width=True)
                 
                 st.markdown("---")
@@ -2658,15 +2839,7 @@ def page_matches():
                 
                 with col1:
                     st.markdown(f"#### {team1}")
-                    team1_full_data = match_data[match_data['team_name'] == team1]
-                    team1_players = team1_full_data.groupby('player_name').agg({
-                        'kills': 'sum',
-                        'deaths': 'sum',
-                        'rating': 'mean',
-                    }).reset_index()
-                    team1_players.columns = ['Player', 'Total Kills', 'Total Deaths', 'Avg Rating']
-                    team1_players['K/D'] = (team1_players['Total Kills'] / team1_players['Total Deaths'].clip(lower=1)).round(2)
-                    team1_players = team1_players.sort_values('Total Kills', ascending=False).head(5)
+                    team1_players = bundle['top_players'][team1].head(5)
                     
                     st.dataframe(
                         team1_players[['Player', 'Total Kills', 'K/D', 'Avg Rating']],
@@ -2676,15 +2849,7 @@ def page_matches():
                 
                 with col2:
                     st.markdown(f"#### {team2}")
-                    team2_full_data = match_data[match_data['team_name'] == team2]
-                    team2_players = team2_full_data.groupby('player_name').agg({
-                        'kills': 'sum',
-                        'deaths': 'sum',
-                        'rating': 'mean',
-                    }).reset_index()
-                    team2_players.columns = ['Player', 'Total Kills', 'Total Deaths', 'Avg Rating']
-                    team2_players['K/D'] = (team2_players['Total Kills'] / team2_players['Total Deaths'].clip(lower=1)).round(2)
-                    team2_players = team2_players.sort_values('Total Kills', ascending=False).head(5)
+                    team2_players = bundle['top_players'][team2].head(5)
                     
                     st.dataframe(
                         team2_players[['Player', 'Total Kills', 'K/D', 'Avg Rating']],
@@ -2693,214 +2858,165 @@ def page_matches():
                     )
             
             # ========== INDIVIDUAL MAP TABS ==========
-            for tab_idx, map_num in enumerate(maps_in_match):
-                with map_tabs[tab_idx + 1]:  # +1 because Overview is tab 0
-                    map_data = match_data[match_data['map_number'] == map_num]
-                    
-                    # Map info header
-                    map_name = map_data['map_name'].iloc[0] if len(map_data) > 0 else 'Unknown'
-                    mode = map_data['mode'].iloc[0] if len(map_data) > 0 else 'Unknown'
-                    
-                    # Display map image with info
-                    col1, col2 = st.columns([1.2, 1.8])
-                    
-                    with col1:
-                        try:
-                            map_image_path = f'data/map_images/{map_name.replace(" ", "_").lower()}.png'
-                            st.image(map_image_path, use_column_width=True)
-                        except:
-                            st.info("📷 Map Image")
-                    
-                    with col2:
-                        st.markdown(f"## {map_name}")
-                        st.metric("Mode", mode)
-                        
-                        # Determine map winner
-                        team1_map_data = map_data[map_data['team_name'] == team1]
-                        team2_map_data = map_data[map_data['team_name'] == team2]
-                        
-                        team1_won = team1_map_data['won_map'].iloc[0] if len(team1_map_data) > 0 else False
-                        team2_won = team2_map_data['won_map'].iloc[0] if len(team2_map_data) > 0 else False
-                        
-                        # Map winner display
-                        if team1_won:
-                            st.success(f"✅ {team1} Won")
-                        elif team2_won:
-                            st.success(f"✅ {team2} Won")
-                    
-                    st.markdown("---")
-                    
-                    # Player stats table
-                    st.markdown("### Player Stats")
-                    
-                    # Add some debug info
-                    st.caption(f"Showing stats for {len(map_data)} players")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    # Team 1 stats
-                    with col1:
-                        st.markdown(f"#### {team1}")
-                        team1_map_stats = map_data[map_data['team_name'] == team1]
-                        if len(team1_map_stats) > 0:
-                            team1_player_list = []
-                            for _, row in team1_map_stats.iterrows():
-                                kd_ratio = row['kills'] / max(row['deaths'], 1)
-                                team1_player_list.append({
-                                    'Player': row['player_name'],
-                                    'Kills': int(row['kills']),
-                                    'Deaths': int(row['deaths']),
-                                    'Assists': int(row['assists']),
-                                    'Damage': int(row['damage']) if row['damage'] else 0,
-                                    'K/D': round(kd_ratio, 2),
-                                    'Rating': round(row['rating'], 2),
-                                })
-                            team1_stats_df = pd.DataFrame(team1_player_list)
-                            team1_stats_df = team1_stats_df.sort_values('Kills', ascending=False)
-                            st.dataframe(
-                                team1_stats_df,
-                                use_container_width=True,
-                                hide_index=True,
-                                column_config={
-                                    'Player': st.column_config.TextColumn('Player', width='medium'),
-                                    'Kills': st.column_config.NumberColumn('Kills', format='%d'),
-                                    'Deaths': st.column_config.NumberColumn('Deaths', format='%d'),
-                                    'Assists': st.column_config.NumberColumn('Assists', format='%d'),
-                                    'Damage': st.column_config.NumberColumn('Damage', format='%d'),
-                                    'K/D': st.column_config.NumberColumn('K/D', format='%.2f'),
-                                    'Rating': st.column_config.NumberColumn('Rating', format='%.2f'),
-                                }
-                            )
-                    
-                    # Team 2 stats
-                    with col2:
-                        st.markdown(f"#### {team2}")
-                        team2_map_stats = map_data[map_data['team_name'] == team2]
-                        if len(team2_map_stats) > 0:
-                            team2_player_list = []
-                            for _, row in team2_map_stats.iterrows():
-                                kd_ratio = row['kills'] / max(row['deaths'], 1)
-                                team2_player_list.append({
-                                    'Player': row['player_name'],
-                                    'Kills': int(row['kills']),
-                                    'Deaths': int(row['deaths']),
-                                    'Assists': int(row['assists']),
-                                    'Damage': int(row['damage']) if row['damage'] else 0,
-                                    'K/D': round(kd_ratio, 2),
-                                    'Rating': round(row['rating'], 2),
-                                })
-                            team2_stats_df = pd.DataFrame(team2_player_list)
-                            team2_stats_df = team2_stats_df.sort_values('Kills', ascending=False)
-                            st.dataframe(
-                                team2_stats_df,
-                                use_container_width=True,
-                                hide_index=True,
-                                column_config={
-                                    'Player': st.column_config.TextColumn('Player', width='medium'),
-                                    'Kills': st.column_config.NumberColumn('Kills', format='%d'),
-                                    'Deaths': st.column_config.NumberColumn('Deaths', format='%d'),
-                                    'Assists': st.column_config.NumberColumn('Assists', format='%d'),
-                                    'Damage': st.column_config.NumberColumn('Damage', format='%d'),
-                                    'K/D': st.column_config.NumberColumn('K/D', format='%.2f'),
-                                    'Rating': st.column_config.NumberColumn('Rating', format='%.2f'),
-                                }
-                            )
-                    
-                    # Team totals
-                    st.markdown("### Team Totals")
+            else:
+                map_num = maps_in_match[tab_labels.index(active_tab) - 1]  # -1 because Overview is first
+                map_data = match_data[match_data['map_number'] == map_num]
+                team1_map_stats = map_data[map_data['team_name'] == team1]
+                team2_map_stats = map_data[map_data['team_name'] == team2]
+                
+                # Map info header
+                map_name = map_data['map_name'].iloc[0] if len(map_data) > 0 else 'Unknown'
+                mode = map_data['mode'].iloc[0] if len(map_data) > 0 else 'Unknown'
+                
+                # Display map image with info
+                col1, col2 = st.columns([1.2, 1.8])
+                
+                with col1:
+                    map_image_path = load_image_index('data/map_images').get(map_name.replace(" ", "_").lower())
+                    if map_image_path:
+                        st.image(map_image_path, use_column_width=True)
+                    else:
+                        st.info("📷 Map Image")
+                
+                with col2:
+                    st.markdown(f"## {map_name}")
+                    st.metric("Mode", mode)
                     
-                    col1, col2 = st.columns(2)
+                    # Determine map winner
+                    team1_won = team1_map_stats['won_map'].iloc[0] if len(team1_map_stats) > 0 else False
+                    team2_won = team2_map_stats['won_map'].iloc[0] if len(team2_map_stats) > 0 else False
                     
+                    # Map winner display
+                    if team1_won:
+                        st.success(f"✅ {team1} Won")
+                    elif team2_won:
+                        st.success(f"✅ {team2} Won")
+                
+                st.markdown("---")
+                
+                # Player stats table
+                st.markdown("### Player Stats")
+                
+                # Add some debug info
+                st.caption(f"Showing stats for {len(map_data)} players")
+                
+                team1_stats_df = _map_player_stats(team1_map_stats)
+                team2_stats_df = _map_player_stats(team2_map_stats)
+                
+                col1, col2 = st.columns(2)
+                
+                # Team 1 stats
+                with col1:
+                    st.markdown(f"#### {team1}")
+                    if len(team1_map_stats) > 0:
+                        st.dataframe(
+                            team1_stats_df.sort_values('Kills', ascending=False),
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={
+                                'Player': st.column_config.TextColumn('Player', width='medium'),
+                                'Kills': st.column_config.NumberColumn('Kills', format='%d'),
+                                'Deaths': st.column_config.NumberColumn('Deaths', format='%d'),
+                                'Assists': st.column_config.NumberColumn('Assists', format='%d'),
+                                'Damage': st.column_config.NumberColumn('Damage', format='%d'),
+                                'K/D': st.column_config.NumberColumn('K/D', format='%.2f'),
+                                'Rating': st.column_config.NumberColumn('Rating', format='%.2f'),
+                            }
+                        )
+                
+                # Team 2 stats
+                with col2:
+                    st.markdown(f"#### {team2}")
+                    if len(team2_map_stats) > 0:
+                        st.dataframe(
+                            team2_stats_df.sort_values('Kills', ascending=False),
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={
+                                'Player': st.column_config.TextColumn('Player', width='medium'),
+                                'Kills': st.column_config.NumberColumn('Kills', format='%d'),
+                                'Deaths': st.column_config.NumberColumn('Deaths', format='%d'),
+                                'Assists': st.column_config.NumberColumn('Assists', format='%d'),
+                                'Damage': st.column_config.NumberColumn('Damage', format='%d'),
+                                'K/D': st.column_config.NumberColumn('K/D', format='%.2f'),
+                                'Rating': st.column_config.NumberColumn('Rating', format='%.2f'),
+                            }
+                        )
+                
+                # Team totals
+                st.markdown("### Team Totals")
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown(f"**{team1}**")
+                    team1_map_agg = team1_map_stats.agg({
+                        'kills': 'sum',
+                        'deaths': 'sum',
+                        'rating': 'mean',
+                    })
+                    col_a, col_b, col_c = st.columns(3)
+                    with col_a:
+                        st.metric("Kills", int(team1_map_agg['kills']))
+                    with col_b:
+                        st.metric("Deaths", int(team1_map_agg['deaths']))
+                    with col_c:
+                        st.metric("Avg Rating", round(team1_map_agg['rating'], 2))
+                
+                with col2:
+                    st.markdown(f"**{team2}**")
+                    team2_map_agg = team2_map_stats.agg({
+                        'kills': 'sum',
+                        'deaths': 'sum',
+                        'rating': 'mean',
+                    })
+                    col_a, col_b, col_c = st.columns(3)
+                    with col_a:
+                        st.metric("Kills", int(team2_map_agg['kills']))
+                    with col_b:
+                        st.metric("Deaths", int(team2_map_agg['deaths']))
+                    with col_c:
+                        st.metric("Avg Rating", round(team2_map_agg['rating'], 2))
+                
+                # Visualizations
+                st.markdown("### Visualizations")
+                
+                col1, col2 = st.columns(2)
+                
+                # Prepare combined data for charts
+                all_stats_df = pd.concat([
+                    team1_stats_df.assign(Team=team1),
+                    team2_stats_df.assign(Team=team2),
+                ])[['Player', 'Team', 'Kills', 'K/D']]
+                
+                if not all_stats_df.empty:
                     with col1:
-                        st.markdown(f"**{team1}**")
-                        team1_map_agg = team1_map_stats.agg({
-                            'kills': 'sum',
-                            'deaths': 'sum',
-                            'rating': 'mean',
-                        })
-                        col_a, col_b, col_c = st.columns(3)
-                        with col_a:
-                            st.metric("Kills", int(team1_map_agg['kills']))
-                        with col_b:
-                            st.metric("Deaths", int(team1_map_agg['deaths']))
-                        with col_c:
-                            st.metric("Avg Rating", round(team1_map_agg['rating'], 2))
+                        # Kills comparison
+                        fig_kills = px.bar(
+                            all_stats_df.sort_values('Kills', ascending=True),
+                            y='Player',
+                            x='Kills',
+                            orientation='h',
+                            color='Team',
+                            color_discrete_map=team_colors,
+                            title=f"Kills - Map {int(map_num)}",
+                        )
+                        fig_kills.update_layout(height=400, showlegend=False)
+                        st.plotly_chart(fig_kills, use_container_width=True)
                     
                     with col2:
-                        st.markdown(f"**{team2}**")
-                        team2_map_agg = team2_map_stats.agg({
-                            'kills': 'sum',
-                            'deaths': 'sum',
-                            'rating': 'mean',
-                        })
-                        col_a, col_b, col_c = st.columns(3)
-                        with col_a:
-                            st.metric("Kills", int(team2_map_agg['kills']))
-                        with col_b:
-                            st.metric("Deaths", int(team2_map_agg['deaths']))
-                        with col_c:
-                            st.metric("Avg Rating", round(team2_map_agg['rating'], 2))
-                    
-                    # Visualizations
-                    st.markdown("### Visualizations")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    # Prepare combined data for charts
-                    all_player_stats = []
-                    
-                    # Add team 1 players
-                    team1_map_stats = map_data[map_data['team_name'] == team1]
-                    for _, row in team1_map_stats.iterrows():
-                        kd_ratio = row['kills'] / max(row['deaths'], 1)
-                        all_player_stats.append({
-                            'Player': row['player_name'],
-                            'Team': team1,
-                            'Kills': int(row['kills']),
-                            'K/D': round(kd_ratio, 2),
-                        })
-                    
-                    # Add team 2 players
-                    team2_map_stats = map_data[map_data['team_name'] == team2]
-                    for _, row in team2_map_stats.iterrows():
-                        kd_ratio = row['kills'] / max(row['deaths'], 1)
-                        all_player_stats.append({
-                            'Player': row['player_name'],
-                            'Team': team2,
-                            'Kills': int(row['kills']),
-                            'K/D': round(kd_ratio, 2),
-                        })
-                    
-                    if all_player_stats:
-                        all_stats_df = pd.DataFrame(all_player_stats)
-                        
-                        with col1:
-                            # Kills comparison
-                            fig_kills = px.bar(
-                                all_stats_df.sort_values('Kills', ascending=True),
-                                y='Player',
-                                x='Kills',
-                                orientation='h',
-                                color='Team',
-                                color_discrete_map={team1: '#1f77b4', team2: '#ff7f0e'},
-                                title=f"Kills - Map {int(map_num)}",
-                            )
-                            fig_kills.update_layout(height=400, showlegend=False)
-                            st.plotly_chart(fig_kills, use_container_width=True)
-                        
-                        with col2:
-                            # K/D comparison
-                            fig_kd = px.bar(
-                                all_stats_df.sort_values('K/D', ascending=True),
-                                y='Player',
-                                x='K/D',
-                                orientation='h',
-                                color='Team',
-                                color_discrete_map={team1: '#1f77b4', team2: '#ff7f0e'},
-                                title=f"K/D Ratio - Map {int(map_num)}",
-                            )
-                            fig_kd.update_layout(height=400, showlegend=False)
-                            st.plotly_chart(fig_kd, use_container_width=True)
+                        # K/D comparison
+                        fig_kd = px.bar(
+                            all_stats_df.sort_values('K/D', ascending=True),
+                            y='Player',
+                            x='K/D',
+                            orientation='h',
+                            color='Team',
+                            color_discrete_map=team_colors,
+                            title=f"K/D Ratio - Map {int(map_num)}",
+                        )
+                        fig_kd.update_layout(height=400, showlegend=False)
+                        st.plotly_chart(fig_kd, use_container_width=True)
         
         st.divider()
         
@@ -2920,27 +3036,15 @@ def page_matches():
         # Team series comparison
         st.markdown("### Team Comparison (Full Series)")
         
-        team_series_stats = []
-        for team in [team1, team2]:
-            team_data = match_data[match_data['team_name'] == team]
-            if len(team_data) > 0:
-                team_stats = team_data.agg({
-                    'kills': 'mean',
-                    'deaths': 'mean',
-                    'assists': 'mean',
-                    'damage': 'mean',
-                    'rating': 'mean',
-                })
-                team_series_stats.append({
-                    'Team': team,
-                    'Avg Kills': round(team_stats['kills'], 2),
-                    'Avg Deaths': round(team_stats['deaths'], 2),
-                    'Avg Assists': round(team_stats['assists'], 2),
-                    'Avg Damage': int(team_stats['damage']),
-                    'Avg Rating': round(team_stats['rating'], 2),
-                })
-        
-        comparison_df = pd.DataFrame(team_series_stats)
+        team_stats = bundle['team_stats']
+        comparison_df = pd.DataFrame({
+            'Team': list(team_stats.index),
+            'Avg Kills': team_stats['kills_mean'].round(2).to_numpy(),
+            'Avg Deaths': team_stats['deaths_mean'].round(2).to_numpy(),
+            'Avg Assists': team_stats['assists_mean'].round(2).to_numpy(),
+            'Avg Damage': team_stats['damage_mean'].astype(int).to_numpy(),
+            'Avg Rating': team_stats['rating_mean'].round(2).to_numpy(),
+        })
         
         st.dataframe(
             comparison_df,
@@ -2959,27 +3063,11 @@ def page_matches():
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_avg_kills = px.bar(
-                comparison_df,
-                x='Team',
-                y='Avg Kills',
-                color='Team',
-                color_discrete_map={team1: '#1f77b4', team2: '#ff7f0e'},
-                title="Avg Kills per Player (Series)",
-            )
-            fig_avg_kills.update_layout(height=350, showlegend=False)
+            fig_avg_kills = _team_bar(comparison_df, 'Avg Kills', "Avg Kills per Player (Series)", team_colors)
             st.plotly_chart(fig_avg_kills, use_container_width=True)
         
         with col2:
-            fig_avg_rating = px.bar(
-                comparison_df,
-                x='Team',
-                y='Avg Rating',
-                color='Team',
-                color_discrete_map={team1: '#1f77b4', team2: '#ff7f0e'},
-                title="Avg Rating per Player (Series)",
-            )
-            fig_avg_rating.update_layout(height=350, showlegend=False)
+            fig_avg_rating = _team_bar(comparison_df, 'Avg Rating', "Avg Rating per Player (Series)", team_colors)
             st.plotly_chart(fig_avg_rating, use_container_width=True)
         
         st.divider()
@@ -2991,15 +3079,7 @@ def page_matches():
         
         with col1:
             st.markdown(f"### {team1}")
-            team1_full_data = match_data[match_data['team_name'] == team1]
-            team1_players = team1_full_data.groupby('player_name').agg({
-                'kills': 'sum',
-                'deaths': 'sum',
-                'rating': 'mean',
-            }).reset_index()
-            team1_players.columns = ['Player', 'Total Kills', 'Total Deaths', 'Avg Rating']
-            team1_players['K/D'] = (team1_players['Total Kills'] / team1_players['Total Deaths'].clip(lower=1)).round(2)
-            team1_players = team1_players.sort_values('Total Kills', ascending=False)
+            team1_players = bundle['top_players'][team1]
             
             st.dataframe(
                 team1_players[['Player', 'Total Kills', 'K/D', 'Avg Rating']],
@@ -3014,15 +3094,7 @@ def page_matches():
         
         with col2:
             st.markdown(f"### {team2}")
-            team2_full_data = match_data[match_data['team_name'] == team2]
-            team2_players = team2_full_data.groupby('player_name').agg({
-                'kills': 'sum',
-                'deaths': 'sum',
-                'rating': 'mean',
-            }).reset_index()
-            team2_players.columns = ['Player', 'Total Kills', 'Total Deaths', 'Avg Rating']
-            team2_players['K/D'] = (team2_players['Total Kills'] / team2_players['Total Deaths'].clip(lower=1)).round(2)
-            team2_players = team2_players.sort_values('Total Kills', ascending=False)
+            team2_players = bundle['top_players'][team2]
             
             st.dataframe(
                 team2_players[['Player', 'Total Kills', 'K/D', 'Avg Rating']],
@@ -3038,53 +3110,99 @@ def page_matches():
     else:
         # Display matches table (no match selected)
         st.markdown("### All Matches")
-        st.markdown("Click on a row to view detailed stats:")
+        st.markdown("Select a row to view detailed stats:")
         
-        # Create display dataframe
-        display_df = matches_list.copy()
+        # Create display dataframe (build_matches_list hands back a fresh copy, so add columns in place)
+        display_df = matches_list
         display_df['Date'] = display_df['date'].dt.strftime('%m/%d/%Y')
-        display_df['Match'] = display_df.apply(
-            lambda row: f"{row['team1']} {int(row['team1_wins'])} vs {int(row['team2_wins'])} {row['team2']}", 
-            axis=1
+        display_df['Match'] = (
+            display_df['team1'].astype(str) + ' ' + display_df['team1_wins'].astype(int).astype(str)
+            + ' vs ' + display_df['team2_wins'].astype(int).astype(str) + ' ' + display_df['team2'].astype(str)
         )
         display_df['Event'] = display_df['event_name']
         display_df['Series'] = display_df['series_type']
         display_df['Venue'] = display_df['is_lan'].map({True: '🏟️ LAN', False: '🌐 Online'})
         
-        # Table header
-        cols = st.columns([1, 3, 2, 1, 1, 0.5])
-        cols[0].markdown("**Date**")
-        cols[1].markdown("**Match**")
-        cols[2].markdown("**Event**")
-        cols[3].markdown("**Series**")
-        cols[4].markdown("**Venue**")
-        
-        st.divider()
+        # One client-side table; selecting a row opens the match detail view
+        selection = st.dataframe(
+            display_df[['Date', 'Match', 'Event', 'Series', 'Venue']],
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="matches_table",
+            column_config={
+                'Match': st.column_config.TextColumn('Match', width='large'),
+            }
+        )
         
-        # Render each row
-        for idx, (_, row) in enumerate(display_df.iterrows()):
-            cols = st.columns([1, 3, 2, 1, 1, 0.5])
-            
-            with cols[0]:
-                st.text(row['Date'])
-            
-            with cols[1]:
-                if st.button(
-                    row['Match'],
-                    key=f"match_{idx}",
-                    use_container_width=True,
-                ):
-                    st.session_state.selected_match_id = row['match_id']
-                    st.rerun()
-            
-            with cols[2]:
-                st.text(row['Event'][:25])
-            
-            with cols[3]:
-                st.text(row['Series'])
-            
-            with cols[4]:
-                st.text(row['Venue'])
+        if selection.selection.rows:
+            st.session_state.selected_match_id = display_df['match_id'].iloc[selection.selection.rows[0]]
+            st.rerun()
+
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def compute_vs_opponent_stats(data_version, opponent):
+    """
+    Cached league-wide stats against one opponent: per-mode averages plus the
+    overall metrics. Returns None if no rows were played against the opponent.
+    TTL of 600 seconds (10 minutes).
+    """
+    df = st.session_state.df
+    
+    # Filter data for matches against selected opponent (league-wide)
+    opponent_df = df[df['opponent_team_name'] == opponent]
+    
+    if opponent_df.empty:
+        return None
+    
+    # Calculate aggregated mode-specific stats in one grouped pass
+    modes = ['Hardpoint', 'Search & Destroy', 'Overload']
+    mode_stats = opponent_df.groupby('mode', sort=False, observed=True).agg(
+        maps=('kills', 'size'),
+        avg_kills=('kills', 'mean'),
+        avg_deaths=('deaths', 'mean'),
+        avg_damage=('damage', 'mean'),
+        wins=('won_map', 'sum'),
+    )
+    mode_stats = mode_stats.reindex([mode for mode in modes if mode in mode_stats.index])
+    mode_stats['kd'] = np.where(mode_stats['avg_deaths'] > 0, mode_stats['avg_kills'] / mode_stats['avg_deaths'], 0)
+    mode_stats['win_pct'] = mode_stats['wins'] / mode_stats['maps'] * 100
+    
+    mode_stats_df = mode_stats.rename_axis('Mode').reset_index()[
+        ['Mode', 'maps', 'avg_kills', 'avg_deaths', 'kd', 'avg_damage', 'win_pct']
+    ].rename(columns={
+        'maps': 'Maps',
+        'avg_kills': 'Avg Kills',
+        'avg_deaths': 'Avg Deaths',
+        'kd': 'K/D',
+        'avg_damage': 'Avg Damage',
+        'win_pct': 'Win %',
+    })
+    
+    # Calculate Map 1-3 Average (sum of mode averages; modes not played count as 0)
+    avg_map_1_3 = float(mode_stats['avg_kills'].sum())
+    
+    kills_total = opponent_df['kills'].sum()
+    deaths_total = opponent_df['deaths'].sum()
+    won = (opponent_df['won_map'] == True).to_numpy()
+    
+    return {
+        'mode_stats': mode_stats_df,
+        'total_maps': won.size,
+        'avg_map_1_3': avg_map_1_3,
+        'overall_kd': kills_total / deaths_total if deaths_total > 0 else 0,
+        'win_rate': won.mean() * 100,
+    }
+
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def vs_opponent_mode_bar(data_version, opponent, y, color_scale, title):
+    """Cached per-mode bar chart of one compute_vs_opponent_stats column."""
+    mode_stats_df = compute_vs_opponent_stats(data_version, opponent)['mode_stats']
+    fig = px.bar(mode_stats_df, x='Mode', y=y, color=y, color_continuous_scale=color_scale, title=title)
+    return fig.update_layout(height=400, showlegend=False)
+
 
 # PAGE 4: HEAD-TO-HEAD
 def page_vs_opponents():
@@ -3114,10 +3232,9 @@ def page_vs_opponents():
         st.warning("No opponent teams available.")
         return
     
-    # Filter data for matches against selected opponent (league-wide)
-    opponent_df = filtered_df[filtered_df['opponent_team_name'] == selected_opponent]
+    stats = compute_vs_opponent_stats(st.session_state.get('data_version', 0), selected_opponent)
     
-    if opponent_df.empty:
+    if stats is None:
         st.info(f"No data available against {selected_opponent}.")
         return
     
@@ -3125,54 +3242,26 @@ def page_vs_opponents():
     st.markdown("*Aggregated averages across all teams who played against this opponent*")
     st.divider()
     
-    # Calculate aggregated mode-specific stats
-    modes = ['Hardpoint', 'Search & Destroy', 'Overload']
-    mode_stats = []
-    
-    for mode in modes:
-        mode_df = opponent_df[opponent_df['mode'] == mode]
-        
-        if not mode_df.empty:
-            stats = {
-                'Mode': mode,
-                'Maps': len(mode_df),
-                'Avg Kills': mode_df['kills'].mean(),
-                'Avg Deaths': mode_df['deaths'].mean(),
-                'K/D': mode_df['kills'].mean() / mode_df['deaths'].mean() if mode_df['deaths'].mean() > 0 else 0,
-                'Avg Damage': mode_df['damage'].mean(),
-                'Win %': (mode_df['won_map'].sum() / len(mode_df) * 100) if len(mode_df) > 0 else 0
-            }
-            mode_stats.append(stats)
+    mode_stats_df = stats['mode_stats']
     
-    if not mode_stats:
+    if mode_stats_df.empty:
         st.info("No mode statistics available.")
         return
     
-    mode_stats_df = pd.DataFrame(mode_stats)
-    
-    # Calculate Map 1-3 Average (sum of mode averages)
-    avg_kills_hp = mode_stats_df[mode_stats_df['Mode'] == 'Hardpoint']['Avg Kills'].values[0] if 'Hardpoint' in mode_stats_df['Mode'].values else 0
-    avg_kills_snd = mode_stats_df[mode_stats_df['Mode'] == 'Search & Destroy']['Avg Kills'].values[0] if 'Search & Destroy' in mode_stats_df['Mode'].values else 0
-    avg_kills_overload = mode_stats_df[mode_stats_df['Mode'] == 'Overload']['Avg Kills'].values[0] if 'Overload' in mode_stats_df['Mode'].values else 0
-    avg_map_1_3 = avg_kills_hp + avg_kills_snd + avg_kills_overload
-    
     # Overall metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_maps = len(opponent_df)
-        st.metric("Total Maps", total_maps)
+        st.metric("Total Maps", stats['total_maps'])
     
     with col2:
-        st.metric("Avg Map 1-3 Kills", f"{avg_map_1_3:.1f}")
+        st.metric("Avg Map 1-3 Kills", f"{stats['avg_map_1_3']:.1f}")
     
     with col3:
-        overall_kd = opponent_df['kills'].sum() / opponent_df['deaths'].sum() if opponent_df['deaths'].sum() > 0 else 0
-        st.metric("Overall K/D", f"{overall_kd:.2f}")
+        st.metric("Overall K/D", f"{stats['overall_kd']:.2f}")
     
     with col4:
-        win_rate = (opponent_df['won_map'].sum() / len(opponent_df) * 100) if len(opponent_df) > 0 else 0
-        st.metric("Win Rate", f"{win_rate:.1f}%")
+        st.metric("Win Rate", f"{stats['win_rate']:.1f}%")
     
     # Mode breakdown table
     st.markdown("### Mode Breakdown")
@@ -3188,44 +3277,30 @@ def page_vs_opponents():
         hide_index=True
     )
     
-    # Visualizations
+    # Visualizations (figures cached per data version and opponent)
+    data_version = st.session_state.get('data_version', 0)
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_kills = px.bar(
-            mode_stats_df,
-            x='Mode',
-            y='Avg Kills',
-            color='Avg Kills',
-            color_continuous_scale='Blues',
-            title=f"Avg Kills by Mode vs {selected_opponent}",
+        fig_kills = vs_opponent_mode_bar(
+            data_version, selected_opponent, 'Avg Kills', 'Blues',
+            f"Avg Kills by Mode vs {selected_opponent}",
         )
-        fig_kills.update_layout(height=400, showlegend=False)
         st.plotly_chart(fig_kills, use_container_width=True)
     
     with col2:
-        fig_kd = px.bar(
-            mode_stats_df,
-            x='Mode',
-            y='K/D',
-            color='K/D',
-            color_continuous_scale='Greens',
-            title=f"K/D by Mode vs {selected_opponent}",
+        fig_kd = vs_opponent_mode_bar(
+            data_version, selected_opponent, 'K/D', 'Greens',
+            f"K/D by Mode vs {selected_opponent}",
         )
-        fig_kd.update_layout(height=400, showlegend=False)
         st.plotly_chart(fig_kd, use_container_width=True)
     
     # Win rate by mode
     st.markdown("### Win Rate by Mode")
-    fig_wr = px.bar(
-        mode_stats_df,
-        x='Mode',
-        y='Win %',
-        color='Win %',
-        color_continuous_scale='RdYlGn',
-        title=f"Win Rate by Mode vs {selected_opponent}",
+    fig_wr = vs_opponent_mode_bar(
+        data_version, selected_opponent, 'Win %', 'RdYlGn',
+        f"Win Rate by Mode vs {selected_opponent}",
     )
-    fig_wr.update_layout(height=400, showlegend=False)
     st.plotly_chart(fig_wr, use_container_width=True)
 
 
@@ -3238,17 +3313,17 @@ def page_upcoming_matches():
     st.markdown('<div class="title-section"><h2>📅 Upcoming Matches</h2></div>', 
                 unsafe_allow_html=True)
     
-    # Import the scraper function
-    from scrape_breakingpoint import fetch_upcoming_matches
-    
     # Add refresh button
     col1, col2 = st.columns([5, 1])
     with col2:
         refresh = st.button("🔄 Refresh", use_container_width=True)
     
+    if refresh:
+        fetch_upcoming_matches_cached.clear()
+    
     # Fetch upcoming matches
     with st.spinner("Loading upcoming matches..."):
-        upcoming_df = fetch_upcoming_matches()
+        upcoming_df = fetch_upcoming_matches_cached()
     
     if upcoming_df is None or upcoming_df.empty:
         st.info("No upcoming CDL matches found.")
@@ -3271,27 +3346,84 @@ def page_upcoming_matches():
         st.caption(f"{len(event_matches)} matches scheduled")
         
         # Display matches in a clean format
-        for _, match in event_matches.iterrows():
+        for match in event_matches.itertuples(index=False):
             col1, col2, col3 = st.columns([2, 3, 2])
             
             with col1:
-                st.markdown(f"**{match['date']}**")
-                st.caption(match['time'])
+                st.markdown(f"**{match.date}**")
+                st.caption(match.time)
             
             with col2:
-                st.markdown(f"**{match['team_1']}** vs **{match['team_2']}**")
-                if match['round_name']:
-                    st.caption(f"{match['round_name']} • Best of {match['best_of']}")
+                st.markdown(f"**{match.team_1}** vs **{match.team_2}**")
+                if match.round_name:
+                    st.caption(f"{match.round_name} • Best of {match.best_of}")
                 else:
-                    st.caption(f"Best of {match['best_of']}")
+                    st.caption(f"Best of {match.best_of}")
             
             with col3:
-                status_emoji = "🔴" if match['status'] == 'live' else "📅"
-                st.markdown(f"{status_emoji} {match['status'].title()}")
+                status_emoji = "🔴" if match.status == 'live' else "📅"
+                st.markdown(f"{status_emoji} {match.status.title()}")
             
             st.divider()
 
 
+@st.cache_data(show_spinner=False)
+def build_demo_betting_lines(matchups):
+    """
+    Demo betting lines for the slip creator: Kills and K/D lines per map and for
+    Maps 1-3, for every player in the given (team1, team2) matchups.
+    Built column-wise from the match x player x stat x map scope grid.
+    """
+    players_by_team = {
+        'OpTic Texas': ['Shotzzy', 'Dashy'],
+        'FaZe Vegas': ['Simp', 'aBeZy'],
+        'Toronto KOI': ['Insight', 'CleanX'],
+        'Boston Breach': ['Cammy', 'Nastie'],
+        'G2 Minnesota': ['Skyz', 'Mamba'],
+        'Paris Gentle Mates': ['Ghosty', 'Envoy'],
+    }
+    stat_types = ['Kills', 'K/D']
+    map_scopes = ['Map 1', 'Map 2', 'Map 3', 'Maps 1-3']
+    
+    # One row per match and player; player_idx counts players within the match
+    players = pd.DataFrame(
+        [
+            (f'demo_match_{match_idx+1}', player, team, player_idx)
+            for match_idx, (team1, team2) in enumerate(matchups)
+            for player_idx, (player, team) in enumerate(
+                [(p, team1) for p in players_by_team[team1]] + [(p, team2) for p in players_by_team[team2]]
+            )
+        ],
+        columns=['match_id', 'player_name', 'team_name', 'player_idx'],
+    )
+    
+    grid = pd.MultiIndex.from_product(
+        [range(len(players)), stat_types, map_scopes], names=['row', 'stat_type', 'map_scope']
+    ).to_frame(index=False)
+    lines = players.iloc[grid['row'].to_numpy()].reset_index(drop=True).join(grid[['stat_type', 'map_scope']])
+    
+    player_idx = lines['player_idx'].to_numpy()
+    is_kills = (lines['stat_type'] == 'Kills').to_numpy()
+    base_line = np.where(is_kills, 18 + player_idx * 2, 1.0 + player_idx * 0.15)
+    # Maps 1-3 kill lines cover three maps
+    line_value = np.where(is_kills & (lines['map_scope'] == 'Maps 1-3').to_numpy(), base_line * 3, base_line)
+    
+    # Python's round is correctly rounded (np.round would turn a 1.15 K/D line into 1.2)
+    lines['line_value'] = [round(value, 1) for value in line_value.tolist()]
+    lines['map_number'] = lines['map_scope'].map({'Map 1': 1, 'Map 2': 2, 'Map 3': 3})
+    lines.insert(0, 'id', np.arange(1, len(lines) + 1))
+    
+    lines = lines[['id', 'match_id', 'player_name', 'team_name', 'stat_type', 'line_value', 'map_scope', 'map_number']]
+    return lines.astype(BETTING_LINE_DTYPES)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def match_filter_options(lines_df, match_id):
+    """Sorted map scopes and stat types offered for one match's props"""
+    match_lines = lines_df[lines_df['match_id'] == match_id]
+    return sorted(match_lines['map_scope'].unique().tolist()), sorted(match_lines['stat_type'].unique().tolist())
+
+
 def page_slip_creator():
     """PrizePicks-style slip creator interface."""
     st.markdown('<div class="title-section"><h2>🎯 Slip Creator</h2></div>', 
@@ -3303,14 +3435,14 @@ def page_slip_creator():
     """)
     
     # Initialize session state
+    # Picks are keyed by "line_id:pick_type" so adding is idempotent and removal is O(1)
     if 'slip_picks' not in st.session_state:
-        st.session_state.slip_picks = []
+        st.session_state.slip_picks = {}
     if 'selected_match_id' not in st.session_state:
         st.session_state.selected_match_id = None
     
     # Try to load betting lines and upcoming matches
     from database import load_betting_lines, save_slip, save_betting_lines
-    from scrape_breakingpoint import fetch_upcoming_matches
     
     # Sidebar for current slip
     with st.sidebar:
@@ -3323,15 +3455,15 @@ def page_slip_creator():
             st.markdown(f"**{total_picks} Pick{'s' if total_picks != 1 else ''}**")
             
             # Display picks
-            for i, pick in enumerate(st.session_state.slip_picks):
+            for i, (pick_key, pick) in enumerate(st.session_state.slip_picks.items()):
                 pick_symbol = "🔺" if pick['pick_type'] == 'over' else "🔻"
                 st.markdown(f"""
                 **{i+1}. {pick_symbol} {pick['player_name']}**  
                 {pick['stat_type']}: {pick['pick_type'].upper()} {pick['line_value']}  
                 _{pick['map_scope']}_
                 """)
-                if st.button(f"❌ Remove", key=f"remove_{i}"):
-                    st.session_state.slip_picks.pop(i)
+                if st.button(f"❌ Remove", key=f"remove_{pick_key}"):
+                    st.session_state.slip_picks.pop(pick_key, None)
                     st.rerun()
                 st.divider()
             
@@ -3361,7 +3493,7 @@ def page_slip_creator():
                         }
                         picks_to_save = [
                             {'betting_line_id': p['line_id'], 'pick_type': p['pick_type']}
-                            for p in st.session_state.slip_picks
+                            for p in st.session_state.slip_picks.values()
                         ]
                         
                         try:
@@ -3370,7 +3502,7 @@ def page_slip_creator():
                                 st.success(f"✅ Slip saved! ID: {slip_id}")
                                 st.balloons()
                                 # Clear picks after successful save
-                                st.session_state.slip_picks = []
+                                st.session_state.slip_picks = {}
                                 time.sleep(1)
                                 st.rerun()
                             else:
@@ -3380,99 +3512,42 @@ def page_slip_creator():
             
             with col2:
                 if st.button("🗑️ Clear Slip", use_container_width=True):
-                    st.session_state.slip_picks = []
+                    st.session_state.slip_picks = {}
                     st.rerun()
     
     # Main content - Show upcoming matches first
     st.markdown("### 🎮 Select a Match")
     
     # Fetch upcoming matches
-    upcoming_df = fetch_upcoming_matches()
+    upcoming_df = fetch_upcoming_matches_cached()
     
     # Check if we have betting lines
-    betting_lines_df = load_betting_lines()
+    betting_lines_df = load_betting_lines_cached()
     
     # Generate demo data if no real data
     if betting_lines_df is None or betting_lines_df.empty:
         st.info("💡 **Demo Mode**: Showing sample data for testing")
         
         # Create mock upcoming matches
-        mock_matches = []
         teams = [
             ('OpTic Texas', 'FaZe Vegas'),
             ('Toronto KOI', 'Boston Breach'),
             ('G2 Minnesota', 'Paris Gentle Mates'),
         ]
+        now = datetime.now()
         
-        for i, (team1, team2) in enumerate(teams):
-            mock_matches.append({
-                'match_id': f'demo_match_{i+1}',
-                'team_1': team1,
-                'team_2': team2,
-                'datetime': datetime.now() + timedelta(days=i+1),
-                'event_name': 'CDL Major 1 Qualifier',
-                'best_of': 5,
-                'status': 'upcoming'
-            })
-        
-        upcoming_df = pd.DataFrame(mock_matches)
+        upcoming_df = pd.DataFrame({
+            'match_id': [f'demo_match_{i+1}' for i in range(len(teams))],
+            'team_1': [team1 for team1, _ in teams],
+            'team_2': [team2 for _, team2 in teams],
+            'datetime': [now + timedelta(days=i+1) for i in range(len(teams))],
+            'event_name': 'CDL Major 1 Qualifier',
+            'best_of': 5,
+            'status': 'upcoming'
+        })
         
         # Create mock betting lines for demo matches
-        mock_data = []
-        players_by_team = {
-            'OpTic Texas': ['Shotzzy', 'Dashy'],
-            'FaZe Vegas': ['Simp', 'aBeZy'],
-            'Toronto KOI': ['Insight', 'CleanX'],
-            'Boston Breach': ['Cammy', 'Nastie'],
-            'G2 Minnesota': ['Skyz', 'Mamba'],
-            'Paris Gentle Mates': ['Ghosty', 'Envoy'],
-        }
-        
-        stat_types = ['Kills', 'K/D']
-        map_scopes = ['Map 1', 'Map 2', 'Map 3', 'Maps 1-3']
-        
-        line_id = 1
-        for match_idx, (team1, team2) in enumerate(teams):
-            match_id = f'demo_match_{match_idx+1}'
-            all_players = players_by_team[team1] + players_by_team[team2]
-            
-            for player_idx, player in enumerate(all_players):
-                team = team1 if player in players_by_team[team1] else team2
-                
-                for stat in stat_types:
-                    for map_scope in map_scopes:
-                        if stat == 'Kills':
-                            base_line = 18 + player_idx * 2
-                        else:  # K/D
-                            base_line = 1.0 + player_idx * 0.15
-                        
-                        # Adjust for map scope
-                        if 'Maps 1-3' in map_scope:
-                            line_val = base_line * 3 if stat == 'Kills' else base_line
-                        else:
-                            line_val = base_line
-                        
-                        map_num = None
-                        if 'Map 1' in map_scope and 'Maps' not in map_scope:
-                            map_num = 1
-                        elif 'Map 2' in map_scope:
-                            map_num = 2
-                        elif 'Map 3' in map_scope:
-                            map_num = 3
-                        
-                        mock_data.append({
-                            'id': line_id,
-                            'match_id': match_id,
-                            'player_name': player,
-                            'team_name': team,
-                            'stat_type': stat,
-                            'line_value': round(line_val, 1),
-                            'map_scope': map_scope,
-                            'map_number': map_num,
-                        })
-                        line_id += 1
-        
-        betting_lines_df = pd.DataFrame(mock_data)
+        betting_lines_df = build_demo_betting_lines(tuple(teams))
         
         # Save mock betting lines to database for demo mode (so they can be referenced in slips)
         # Only save if lines don't already exist in database
@@ -3482,6 +3557,7 @@ def page_slip_creator():
                 if existing_lines is None or existing_lines.empty:
                     # Save demo lines to database
                     save_betting_lines(betting_lines_df)
+                    load_betting_lines_cached.clear()
                     st.caption("✅ Demo betting lines loaded into database")
             except Exception as e:
                 st.caption(f"⚠️ Could not save demo lines to database: {e}")
@@ -3490,8 +3566,14 @@ def page_slip_creator():
         st.warning("⚠️ No upcoming matches found. Check back later!")
         return
     
+    # Props available per match, counted once for all cards
+    lines_per_match = betting_lines_df.groupby('match_id', sort=False, observed=True).size() if betting_lines_df is not None else None
+    
+    # Format match times once for all cards
+    display_times = pd.to_datetime(upcoming_df['datetime'], errors='coerce').dt.strftime('%b %d, %I:%M%p').fillna('TBD')
+    
     # Display upcoming matches as clickable cards
-    for idx, match in upcoming_df.iterrows():
+    for (idx, match), display_time in zip(upcoming_df.iterrows(), display_times):
         match_id = match['match_id']
         is_selected = st.session_state.selected_match_id == match_id
         
@@ -3512,12 +3594,12 @@ def page_slip_creator():
                 st.rerun()
         
         with col2:
-            st.caption(match['datetime'].strftime('%b %d, %I:%M%p') if hasattr(match['datetime'], 'strftime') else 'TBD')
+            st.caption(display_time)
         
         with col3:
             # Count available lines for this match
-            if betting_lines_df is not None:
-                lines_count = len(betting_lines_df[betting_lines_df['match_id'] == match_id])
+            if lines_per_match is not None:
+                lines_count = int(lines_per_match.get(match_id, 0))
                 st.caption(f"📊 {lines_count} props")
     
     st.divider()
@@ -3536,82 +3618,79 @@ def page_slip_creator():
             return
         
         # Filters
+        map_scopes, stat_types = match_filter_options(betting_lines_df, st.session_state.selected_match_id)
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            map_options = ['All'] + sorted(match_lines['map_scope'].unique().tolist())
+            map_options = ['All'] + map_scopes
             selected_map = st.selectbox("Map Scope", options=map_options, key="map_filter")
         
         with col2:
-            stat_options = ['All'] + sorted(match_lines['stat_type'].unique().tolist())
+            stat_options = ['All'] + stat_types
             selected_stat = st.selectbox("Stat Type", options=stat_options, key="stat_filter")
         
         with col3:
             search_player = st.text_input("Search Player", "", key="player_search")
         
-        # Apply filters
-        filtered_lines = match_lines.copy()
+        # Apply filters as one combined mask
+        mask = np.ones(len(match_lines), dtype=bool)
         if selected_map != 'All':
-            filtered_lines = filtered_lines[filtered_lines['map_scope'] == selected_map]
+            mask &= (match_lines['map_scope'] == selected_map).to_numpy()
         if selected_stat != 'All':
-            filtered_lines = filtered_lines[filtered_lines['stat_type'] == selected_stat]
+            mask &= (match_lines['stat_type'] == selected_stat).to_numpy()
         if search_player:
-            filtered_lines = filtered_lines[filtered_lines['player_name'].str.contains(search_player, case=False)]
+            mask &= match_lines['player_name'].str.contains(search_player, case=False, na=False).to_numpy()
+        filtered_lines = match_lines[mask]
         
         # Display props
         st.markdown(f"_Showing {len(filtered_lines)} props_")
         
-        for idx, row in filtered_lines.iterrows():
-            col1, col2, col3 = st.columns([3, 2, 2])
-            
-            with col1:
-                st.markdown(f"**{row['player_name']}** ({row['team_name']})")
-                st.caption(f"{row['stat_type']} • {row['map_scope']}")
-            
-            with col2:
-                st.metric("Line", f"{row['line_value']}")
-            
-            with col3:
-                pick_col1, pick_col2 = st.columns(2)
-                with pick_col1:
-                    if st.button("�� Over", key=f"over_{row['id']}", use_container_width=True):
-                        pick = {
-                            'line_id': row['id'],
-                            'player_name': row['player_name'],
-                            'team_name': row['team_name'],
-                            'stat_type': row['stat_type'],
-                            'line_value': row['line_value'],
-                            'map_scope': row['map_scope'],
-                            'pick_type': 'over'
-                        }
-                        # Check for duplicates before adding
-                        if not any(p['line_id'] == pick['line_id'] and p['pick_type'] == 'over' for p in st.session_state.slip_picks):
-                            st.session_state.slip_picks.append(pick)
-                            st.toast(f"✅ Added {row['player_name']} Over {row['line_value']}", icon="🔺")
-                        else:
-                            st.toast(f"⚠️ Already in slip!", icon="⚠️")
-                        st.rerun()
-                
-                with pick_col2:
-                    if st.button("🔻 Under", key=f"under_{row['id']}", use_container_width=True):
-                        pick = {
-                            'line_id': row['id'],
-                            'player_name': row['player_name'],
-                            'team_name': row['team_name'],
-                            'stat_type': row['stat_type'],
-                            'line_value': row['line_value'],
-                            'map_scope': row['map_scope'],
-                            'pick_type': 'under'
-                        }
-                        # Check for duplicates before adding
-                        if not any(p['line_id'] == pick['line_id'] and p['pick_type'] == 'under' for p in st.session_state.slip_picks):
-                            st.session_state.slip_picks.append(pick)
-                            st.toast(f"✅ Added {row['player_name']} Under {row['line_value']}", icon="🔻")
-                        else:
-                            st.toast(f"⚠️ Already in slip!", icon="⚠️")
-                        st.rerun()
+        # One editable table instead of a row of widgets per prop: pick Over/Under
+        # in the Pick column, then add every chosen prop to the slip at once.
+        # Inside a form, choosing picks does not rerun the page until submit.
+        editor_key = f"props_editor_{st.session_state.selected_match_id}_{selected_map}_{selected_stat}_{search_player}"
+        with st.form("picks_form", clear_on_submit=True):
+            edited_lines = st.data_editor(
+                filtered_lines[['id', 'player_name', 'team_name', 'stat_type', 'map_scope', 'line_value']].assign(pick=None),
+                use_container_width=True,
+                hide_index=True,
+                column_order=['player_name', 'team_name', 'stat_type', 'map_scope', 'line_value', 'pick'],
+                disabled=['id', 'player_name', 'team_name', 'stat_type', 'map_scope', 'line_value'],
+                column_config={
+                    'player_name': st.column_config.TextColumn('Player'),
+                    'team_name': st.column_config.TextColumn('Team'),
+                    'stat_type': st.column_config.TextColumn('Stat'),
+                    'map_scope': st.column_config.TextColumn('Map Scope'),
+                    'line_value': st.column_config.NumberColumn('Line'),
+                    'pick': st.column_config.SelectboxColumn('Pick', options=['Over', 'Under']),
+                },
+                key=editor_key,
+            )
+            submitted = st.form_submit_button("➕ Add Selected Picks to Slip")
+        
+        if submitted:
+            chosen_lines = edited_lines[edited_lines['pick'].notna()]
+            for row in chosen_lines.itertuples(index=False):
+                pick_type = row.pick.lower()
+                pick = {
+                    'line_id': row.id,
+                    'player_name': row.player_name,
+                    'team_name': row.team_name,
+                    'stat_type': row.stat_type,
+                    'line_value': row.line_value,
+                    'map_scope': row.map_scope,
+                    'pick_type': pick_type
+                }
+                pick_key = f"{row.id}:{pick_type}"
+                if pick_key not in st.session_state.slip_picks:
+                    st.session_state.slip_picks[pick_key] = pick
+                    st.toast(f"✅ Added {row.player_name} {row.pick} {row.line_value}", icon="🔺" if pick_type == 'over' else "🔻")
+                else:
+                    st.toast(f"⚠️ Already in slip!", icon="⚠️")
             
-            st.divider()
+            # clear_on_submit has reset the Pick column; rerun so the sidebar slip shows the new picks
+            if not chosen_lines.empty:
+                st.rerun()
     else:
         st.info("👆 Select a match above to view available player props")
     
@@ -3667,24 +3746,26 @@ def page_slip_tracker():
             with st.spinner("Refreshing match data and checking slip results..."):
                 # Refresh the main data
                 from scrape_breakingpoint import update_data
-                from database import load_from_cache, update_slip_results, load_slips as load_slips_db
+                from database import update_slip_results, load_slips as load_slips_db
                 
                 # Update match data
                 updated = update_data(force_refresh=False)
                 
                 if updated:
                     # Reload data into session state
-                    st.session_state.df = load_from_cache()
+                    clear_data_caches()
+                    # Same load path as startup: dates parsed, CDL maps only, categorical columns
+                    store_session_data(load_data_with_refresh())
                     
                     # Check all pending slips
                     slips_df = load_slips_db()
                     if slips_df is not None and not slips_df.empty:
-                        pending_slips = slips_df[slips_df['status'] == 'pending']
+                        pending_ids = slips_df.loc[slips_df['status'] == 'pending', 'id'].tolist()
                         updated_count = 0
                         
-                        for _, slip in pending_slips.iterrows():
-                            if st.session_state.df is not None:
-                                if update_slip_results(slip['id'], st.session_state.df):
+                        if st.session_state.df is not None:
+                            for slip_id in pending_ids:
+                                if update_slip_results(slip_id, st.session_state.df):
                                     updated_count += 1
                         
                         if updated_count > 0:
@@ -3712,11 +3793,15 @@ def page_slip_tracker():
     st.markdown("### 📊 Overall Stats")
     col1, col2, col3, col4 = st.columns(4)
     
+    # Split the slips by status once; counts, payouts and the status filter all reuse it
+    slips_by_status = dict(list(slips_df.groupby('status', sort=False)))
+    no_slips = slips_df.iloc[:0]
+    
     total_slips = len(slips_df)
-    won_slips = len(slips_df[slips_df['status'] == 'won'])
-    pending_slips = len(slips_df[slips_df['status'] == 'pending'])
+    won_slips = len(slips_by_status.get('won', no_slips))
+    pending_slips = len(slips_by_status.get('pending', no_slips))
     total_staked = slips_df['stake'].sum()
-    total_payout = slips_df[slips_df['status'] == 'won']['actual_payout'].sum()
+    total_payout = slips_by_status.get('won', no_slips)['actual_payout'].sum()
     
     with col1:
         st.metric("Total Slips", total_slips)
@@ -3735,11 +3820,11 @@ def page_slip_tracker():
         if st.button(f"🔄 Check All Pending Results ({pending_slips} slips)", use_container_width=False):
             with st.spinner("Checking results for all pending slips..."):
                 from database import update_slip_results
-                pending_slip_list = slips_df[slips_df['status'] == 'pending']
+                pending_ids = slips_by_status.get('pending', no_slips)['id'].tolist()
                 updated_count = 0
                 
-                for _, slip in pending_slip_list.iterrows():
-                    if update_slip_results(slip['id'], st.session_state.df):
+                for slip_id in pending_ids:
+                    if update_slip_results(slip_id, st.session_state.df):
                         updated_count += 1
                 
                 if updated_count > 0:
@@ -3755,16 +3840,19 @@ def page_slip_tracker():
         index=0
     )
     
-    filtered_slips = slips_df.copy()
-    if status_filter != 'All':
-        filtered_slips = filtered_slips[filtered_slips['status'] == status_filter.lower()]
+    if status_filter == 'All':
+        filtered_slips = slips_df
+    else:
+        filtered_slips = slips_by_status.get(status_filter.lower(), no_slips)
     
     # Display slips
     st.markdown(f"### 🎫 Slips ({len(filtered_slips)})")
     
     from database import get_slip_picks, update_slip_results
     
-    for _, slip in filtered_slips.iterrows():
+    created_labels = pd.to_datetime(filtered_slips['created_at']).dt.strftime('%m/%d/%Y %I:%M%p')
+    
+    for (_, slip), created_label in zip(filtered_slips.iterrows(), created_labels):
         # Status emoji
         status_emoji = {
             'pending': '⏳',
@@ -3773,7 +3861,7 @@ def page_slip_tracker():
             'void': '⚪'
         }.get(slip['status'], '❓')
         
-        with st.expander(f"{status_emoji} {slip['slip_name']} - {slip['created_at'].strftime('%m/%d/%Y %I:%M%p')}"):
+        with st.expander(f"{status_emoji} {slip['slip_name']} - {created_label}"):
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
@@ -3807,15 +3895,15 @@ def page_slip_tracker():
                                 st.warning("⚠️ Could not update results")
                 
                 # Display each pick
-                for idx, pick in picks_df.iterrows():
-                    pick_symbol = "🔺" if pick['pick_type'] == 'over' else "🔻"
+                for pick in picks_df.itertuples(index=False):
+                    pick_symbol = "🔺" if pick.pick_type == 'over' else "🔻"
                     
                     # Determine if pick hit
-                    if pick['result'] == 'won':
+                    if pick.result == 'won':
                         result_color = "green"
                         result_emoji = "✅"
                         result_text = "HIT"
-                    elif pick['result'] == 'lost':
+                    elif pick.result == 'lost':
                         result_color = "red"
                         result_emoji = "❌"
                         result_text = "CHALKED"
@@ -3828,13 +3916,13 @@ def page_slip_tracker():
                     pcol1, pcol2, pcol3 = st.columns([3, 2, 2])
                     
                     with pcol1:
-                        st.markdown(f"{pick_symbol} **{pick['player_name']}** ({pick['team_name']})")
-                        st.caption(f"{pick['stat_type']} • {pick['map_scope']}")
+                        st.markdown(f"{pick_symbol} **{pick.player_name}** ({pick.team_name})")
+                        st.caption(f"{pick.stat_type} • {pick.map_scope}")
                     
                     with pcol2:
-                        st.markdown(f"**Line:** {pick['pick_type'].upper()} {pick['line_value']}")
-                        if pick['actual_value'] is not None:
-                            st.markdown(f"**Actual:** {pick['actual_value']:.2f}")
+                        st.markdown(f"**Line:** {pick.pick_type.upper()} {pick.line_value}")
+                        if pick.actual_value is not None:
+                            st.markdown(f"**Actual:** {pick.actual_value:.2f}")
                     
                     with pcol3:
                         st.markdown(f":{result_color}[{result_emoji} **{result_text}**]")
@@ -3850,6 +3938,37 @@ def page_slip_tracker():
                 st.caption("_No pick details available_")
 
 
+def render_upcoming_banner():
+    """
+    Banner with the next three upcoming matches.
+    Reads the cached scrape, so navigating between pages does not refetch breakingpoint.gg.
+    """
+    try:
+        upcoming_df = fetch_upcoming_matches_cached()
+        
+        if upcoming_df is not None and not upcoming_df.empty:
+            # Get next 3 upcoming matches
+            next_matches = upcoming_df.head(3)
+            
+            # Build banner HTML
+            match_dates = next_matches['datetime'].dt.strftime('%b %d')
+            items = [
+                f'<div class="upcoming-match-item">{match_date} • '
+                f"{team_1} <span class='upcoming-vs'>vs</span> {team_2}</div>"
+                for match_date, team_1, team_2 in zip(match_dates, next_matches['team_1'], next_matches['team_2'])
+            ]
+            banner_html = (
+                '<div class="upcoming-banner">'
+                '<span class="upcoming-banner-title">🔥 UPCOMING MATCHES</span>'
+                '<div class="upcoming-banner-content">'
+                + ''.join(items)
+                + '</div></div>'
+            )
+            st.markdown(banner_html, unsafe_allow_html=True)
+    except Exception as e:
+        pass  # Silently fail if upcoming matches can't be loaded
+
+
 # ============================================================================
 # MAIN APP
 # ============================================================================
@@ -3887,7 +4006,10 @@ def main():
         with loading_placeholder:
             show_loading_animation("Loading CDL Data", "Fetching player statistics and match data...")
         
-        st.session_state.df = load_data_with_refresh()
+        # Warm the cached upcoming matches fetch on a worker thread while the database loads (both wait on I/O)
+        with ThreadPoolExecutor(max_workers=1, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())) as executor:
+            executor.submit(fetch_upcoming_matches_cached)
+            store_session_data(load_data_with_refresh())
         loading_placeholder.empty()
         
         if st.session_state.df.empty:
@@ -3911,9 +4033,8 @@ def main():
     
     with col1:
         try:
-            from database import get_last_scrape_date, get_cache_stats
-            last_scrape = get_last_scrape_date()
-            status = get_cache_stats()
+            last_scrape = get_last_scrape_date_cached()
+            status = get_cache_stats_cached()
             
             if last_scrape:
                 st.caption(f"� Last updated: {last_scrape.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -3926,38 +4047,18 @@ def main():
     
     with col2:
         if st.button("🔄 Refresh Data", use_container_width=True):
+            # Also force a fresh upcoming matches scrape for the banner
+            fetch_upcoming_matches_cached.clear()
             if refresh_data():
                 # Reload the data after refresh
-                st.session_state.df = load_data_with_refresh()
+                store_session_data(load_data_with_refresh())
                 st.rerun()
     
     st.divider()
     
     # Show upcoming matches banner
     if not st.session_state.df.empty:
-        try:
-            from scrape_breakingpoint import fetch_upcoming_matches
-            upcoming_df = fetch_upcoming_matches()
-            
-            if upcoming_df is not None and not upcoming_df.empty:
-                # Get next 3 upcoming matches
-                next_matches = upcoming_df.head(3)
-                
-                # Build banner HTML
-                banner_html = '<div class="upcoming-banner">'
-                banner_html += '<span class="upcoming-banner-title">🔥 UPCOMING MATCHES</span>'
-                banner_html += '<div class="upcoming-banner-content">'
-                
-                for _, match in next_matches.iterrows():
-                    match_date = match['datetime'].strftime('%b %d')
-                    match_time = match['datetime'].strftime('%I:%M %p')
-                    matchup = f"{match['team_1']} <span class='upcoming-vs'>vs</span> {match['team_2']}"
-                    banner_html += f'<div class="upcoming-match-item">{match_date} • {matchup}</div>'
-                
-                banner_html += '</div></div>'
-                st.markdown(banner_html, unsafe_allow_html=True)
-        except Exception as e:
-            pass  # Silently fail if upcoming matches can't be loaded
+        render_upcoming_banner()
         
         st.divider()
         
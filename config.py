@@ -5,6 +5,8 @@ Customize these settings to match your data schema and preferences.
 
 import os
 
+import pandas as pd
+
 # ============================================================================
 # DATABASE CONFIGURATION
 # ============================================================================
@@ -104,6 +106,13 @@ def get_player_position(player_name: str) -> str:
     """Get the position for a player, returns 'Unknown' if not found"""
     return PLAYER_POSITIONS.get(player_name, 'Unknown')
 
+# Player -> position as a Series, for mapping a whole player_name column at once
+POSITION_MAP = pd.Series(PLAYER_POSITIONS, name='position')
+
+def add_positions(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df with a position column for each player_name, 'Unknown' if not found"""
+    return df.assign(position=df['player_name'].map(POSITION_MAP).astype(object).fillna('Unknown'))
+
 # ============================================================================
 # COLUMN MAPPING
 # ============================================================================
@@ -3,11 +3,12 @@ Database module for CDL Stats Dashboard
 Handles PostgreSQL connection, caching, and data persistence
 """
 
-from sqlalchemy import create_engine, Column, String, Integer, Boolean, DateTime, Numeric, ForeignKey, func
+from sqlalchemy import create_engine, Column, String, Integer, Boolean, DateTime, Numeric, ForeignKey, Index, func, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime, timedelta
 import pandas as pd
+import numpy as np
 from typing import Optional
 import os
 
@@ -52,7 +53,7 @@ class Match(Base):
     __tablename__ = "matches"
     
     match_id = Column(String(50), primary_key=True)
-    date = Column(DateTime, nullable=False)
+    date = Column(DateTime, nullable=False, index=True)
     event_name = Column(String(255))
     series_type = Column(String(100))
     is_lan = Column(Boolean)
@@ -74,11 +75,14 @@ class Match(Base):
 class PlayerStats(Base):
     """Player statistics per map per match"""
     __tablename__ = "player_stats"
+    __table_args__ = (
+        Index('ix_ps_player_mode', 'player_name', 'mode'),
+    )
     
     id = Column(Integer, primary_key=True)
-    match_id = Column(String(50), ForeignKey("matches.match_id"), nullable=False)
-    player_name = Column(String(255), nullable=False)
-    team_name = Column(String(255), nullable=False)
+    match_id = Column(String(50), ForeignKey("matches.match_id"), nullable=False, index=True)
+    player_name = Column(String(255), nullable=False, index=True)
+    team_name = Column(String(255), nullable=False, index=True)
     opponent_team_name = Column(String(255))
     position = Column(String(50))  # AR, SMG, or Flex
     map_number = Column(Integer)
@@ -183,6 +187,10 @@ def init_db():
     
     try:
         Base.metadata.create_all(bind=engine)
+        # create_all skips tables that already exist, so add any missing indexes to them
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
         print("✅ Database initialized")
         return True
     except Exception as e:
@@ -198,6 +206,52 @@ def get_session():
     return SessionLocal()
 
 
+def _player_stats_records(df: pd.DataFrame) -> list:
+    """
+    Build player_stats rows from a scraped stats DataFrame
+    
+    Args:
+        df: DataFrame with player stats from scraper
+    
+    Returns:
+        list: One dict per row keyed by PlayerStats column, with None for missing values
+    """
+    from config import add_positions
+    
+    def column(name, default=None):
+        return df[name] if name in df.columns else pd.Series(default, index=df.index, dtype=object)
+    
+    def whole(values):
+        # Truncate like int() did per row, so non-integral floats don't break the Int64 cast
+        return np.trunc(pd.to_numeric(values).astype('float64')).astype('Int64')
+    
+    # Handle both 'map_number' and 'game_num' column names
+    map_num = df['map_number'] if 'map_number' in df.columns else column('game_num')
+    
+    records = pd.DataFrame({
+        'match_id': df['match_id'],
+        'player_name': df['player_name'],
+        'team_name': df['team_name'],
+        'opponent_team_name': column('opponent_team_name'),
+        'map_number': whole(map_num),
+        'map_name': column('map_name'),
+        'mode': column('mode'),
+        'kills': whole(df['kills']),
+        'deaths': whole(df['deaths']),
+        'assists': whole(df['assists']),
+        'damage': pd.to_numeric(df['damage']).astype(float),
+        'rating': pd.to_numeric(df['rating']).astype(float),
+        'won_map': df['won_map'].astype('boolean'),
+        'game_num': whole(df['game_num'] if 'game_num' in df.columns else map_num),
+        'team_score': whole(column('team_score')),
+        'opponent_score': whole(column('opponent_score')),
+    })
+    
+    records = add_positions(records)
+    
+    return records.astype(object).where(records.notna(), None).to_dict(orient='records')
+
+
 def cache_match_data(df: pd.DataFrame) -> bool:
     """
     Cache player stats dataframe to database
@@ -223,79 +277,38 @@ def cache_match_data(df: pd.DataFrame) -> bool:
         session.query(Match).delete()
         session.commit()
         
-        # Process each match to calculate scores
-        for match_id in df['match_id'].unique():
-            match_df = df[df['match_id'] == match_id]
-            
-            # Get teams
-            teams = sorted(match_df['team_name'].unique())
-            if len(teams) < 2:
-                continue
-            
-            team1_name = teams[0]
-            team2_name = teams[1]
-            
-            # Calculate scores (number of maps won)
-            team1_score = len(match_df[
-                (match_df['team_name'] == team1_name) & 
-                (match_df['won_map'] == True)
-            ]['map_number'].unique())
-            
-            team2_score = len(match_df[
-                (match_df['team_name'] == team2_name) & 
-                (match_df['won_map'] == True)
-            ]['map_number'].unique())
-            
-            # Get match metadata
-            match_row = match_df.iloc[0]
-            
-            # Create match record with teams and scores
-            match = Match(
-                match_id=match_id,
-                date=pd.to_datetime(match_row['date']).to_pydatetime(),
-                event_name=str(match_row['event_name']),
-                series_type=str(match_row['series_type']),
-                is_lan=bool(match_row['is_lan']),
-                season=str(match_row['season']),
-                team1_name=str(team1_name),
-                team2_name=str(team2_name),
-                team1_score=int(team1_score),
-                team2_score=int(team2_score),
-            )
-            session.add(match)
-        
+        # Teams per match in name order; matches with fewer than two teams are skipped
+        teams = df.drop_duplicates(['match_id', 'team_name'])[['match_id', 'team_name']].sort_values(['match_id', 'team_name'])
+        team_order = teams.groupby('match_id', sort=False).cumcount()
+        team1_name = teams[team_order == 0].set_index('match_id')['team_name']
+        team2_name = teams[team_order == 1].set_index('match_id')['team_name']
+        
+        # Scores: number of distinct maps each team won
+        maps_won = df[df['won_map'] == True].groupby(['match_id', 'team_name'])['map_number'].nunique()
+        
+        # Match metadata from each match's first row, with teams and scores
+        matches = df.drop_duplicates('match_id').set_index('match_id')
+        matches = matches[matches.index.isin(team2_name.index)]
+        team1 = team1_name.reindex(matches.index)
+        team2 = team2_name.reindex(matches.index)
+        match_records = pd.DataFrame({
+            'match_id': matches.index,
+            'date': pd.to_datetime(matches['date']).to_numpy(),
+            'event_name': matches['event_name'].astype(str).to_numpy(),
+            'series_type': matches['series_type'].astype(str).to_numpy(),
+            'is_lan': matches['is_lan'].astype(bool).to_numpy(),
+            'season': matches['season'].astype(str).to_numpy(),
+            'team1_name': team1.astype(str).to_numpy(),
+            'team2_name': team2.astype(str).to_numpy(),
+            'team1_score': maps_won.reindex(list(zip(matches.index, team1)), fill_value=0).to_numpy(),
+            'team2_score': maps_won.reindex(list(zip(matches.index, team2)), fill_value=0).to_numpy(),
+        }).to_dict(orient='records')
+        
+        session.bulk_insert_mappings(Match, match_records)
         session.commit()
         
-        # Insert player stats
-        for _, row in df.iterrows():
-            # Handle both 'map_number' and 'game_num' column names
-            map_num = row.get('map_number') or row.get('game_num')
-            
-            # Get player position
-            from config import get_player_position
-            position = get_player_position(row['player_name'])
-            
-            player_stat = PlayerStats(
-                match_id=row['match_id'],
-                player_name=row['player_name'],
-                team_name=row['team_name'],
-                opponent_team_name=row.get('opponent_team_name'),
-                position=position,
-                map_number=int(map_num) if pd.notna(map_num) else None,
-                map_name=row.get('map_name'),
-                mode=row.get('mode'),
-                kills=int(row['kills']) if pd.notna(row['kills']) else None,
-                deaths=int(row['deaths']) if pd.notna(row['deaths']) else None,
-                assists=int(row['assists']) if pd.notna(row['assists']) else None,
-                damage=float(row['damage']) if pd.notna(row['damage']) else None,
-                rating=float(row['rating']) if pd.notna(row['rating']) else None,
-                won_map=bool(row['won_map']) if pd.notna(row['won_map']) else None,
-                game_num=int(row.get('game_num', map_num)) if pd.notna(row.get('game_num', map_num)) else None,
-                team_score=int(row['team_score']) if pd.notna(row.get('team_score')) else None,
-                opponent_score=int(row['opponent_score']) if pd.notna(row.get('opponent_score')) else None,
-            )
-            session.add(player_stat)
-        
+        # Insert player stats in one batch, columns converted to the ORM types up front
+        session.bulk_insert_mappings(PlayerStats, _player_stats_records(df))
         session.commit()
         
         match_count = df['match_id'].nunique()
@@ -317,7 +330,8 @@ def load_from_cache() -> Optional[pd.DataFrame]:
     Load cached player stats from database
     
     Returns:
-        DataFrame with all cached player stats, or None if cache is empty
+        DataFrame with all cached player stats (empty if nothing is cached yet),
+        or None if the database could not be read
     """
     if not DATABASE_AVAILABLE:
         print("⚠️ Database not available. Cannot load from cache.")
@@ -330,42 +344,48 @@ def load_from_cache() -> Optional[pd.DataFrame]:
         return None
     
     try:
-        # Query all player stats with match info
-        query = session.query(PlayerStats).all()
+        # Query all player stats with match info in one JOIN
+        stmt = (
+            select(
+                PlayerStats.match_id,
+                Match.date,
+                Match.event_name,
+                Match.series_type,
+                Match.is_lan,
+                Match.season,
+                PlayerStats.player_name,
+                PlayerStats.team_name,
+                PlayerStats.opponent_team_name,
+                PlayerStats.position,
+                PlayerStats.map_number,
+                PlayerStats.map_name,
+                PlayerStats.mode,
+                PlayerStats.kills,
+                PlayerStats.deaths,
+                PlayerStats.assists,
+                PlayerStats.damage,
+                PlayerStats.rating,
+                PlayerStats.won_map,
+                PlayerStats.game_num,
+                PlayerStats.team_score,
+                PlayerStats.opponent_score,
+            )
+            .join(Match, PlayerStats.match_id == Match.match_id)
+            .order_by(PlayerStats.id)
+        )
         
-        if not query:
-            print("📭 Cache is empty")
-            return None
+        # Read straight into a DataFrame; Numeric columns as floats instead of Decimal objects
+        df = pd.read_sql(
+            stmt,
+            session.connection(),
+            parse_dates=['date'],
+            dtype={'damage': 'float64', 'rating': 'float64'},
+        )
         
-        # Convert to DataFrame
-        data = []
-        for stat in query:
-            data.append({
-                'match_id': stat.match_id,
-                'date': stat.match.date,
-                'event_name': stat.match.event_name,
-                'series_type': stat.match.series_type,
-                'is_lan': stat.match.is_lan,
-                'season': stat.match.season,
-                'player_name': stat.player_name,
-                'team_name': stat.team_name,
-                'opponent_team_name': stat.opponent_team_name,
-                'position': stat.position,
-                'map_number': stat.map_number,
-                'map_name': stat.map_name,
-                'mode': stat.mode,
-                'kills': stat.kills,
-                'deaths': stat.deaths,
-                'assists': stat.assists,
-                'damage': stat.damage,
-                'rating': stat.rating,
-                'won_map': stat.won_map,
-                'game_num': stat.game_num,
-                'team_score': getattr(stat, 'team_score', None),  # Backward compatible
-                'opponent_score': getattr(stat, 'opponent_score', None),  # Backward compatible
-            })
+        if df.empty:
+            print("📭 Cache is empty")
+            return df
         
-        df = pd.DataFrame(data)
         print(f"✅ Loaded {len(df)} player records from cache")
         return df
         
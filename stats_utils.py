@@ -102,7 +102,7 @@ def get_player_mode_stats(
     if filtered_df.empty:
         return pd.DataFrame()
     
-    mode_stats = filtered_df.groupby('mode').agg({
+    mode_stats = filtered_df.groupby('mode', observed=True).agg({
         'kills': ['mean', 'sum', 'count'],
         'deaths': ['mean', 'sum'],
         'assists': ['mean'],
@@ -182,7 +182,7 @@ def get_player_map_mode_stats(
     if filtered_df.empty:
         return pd.DataFrame()
     
-    map_stats = filtered_df.groupby('map_name').agg({
+    map_stats = filtered_df.groupby('map_name', observed=True).agg({
         'kills': ['mean', 'count'],
         'deaths': ['mean'],
         'assists': ['mean'],
@@ -273,7 +273,7 @@ def get_player_vs_opponent_stats(
         return pd.DataFrame()
     
     # Group by opponent
-    vs_stats = filtered_df.groupby('opponent_team_name').agg({
+    vs_stats = filtered_df.groupby('opponent_team_name', observed=True).agg({
         'kills': ['mean', 'count'],
         'deaths': ['mean'],
         'assists': ['mean'],
@@ -386,7 +386,9 @@ def get_mode_distribution(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with mode distribution
     """
-    mode_dist = df['mode'].value_counts().reset_index()
+    # Categorical columns also report unobserved categories, so drop zero counts
+    mode_counts = df['mode'].value_counts()
+    mode_dist = mode_counts[mode_counts > 0].reset_index()
     mode_dist.columns = ['Mode', 'Count']
     return mode_dist
 
@@ -406,7 +408,9 @@ def get_map_distribution(df: pd.DataFrame, mode: Optional[str] = None) -> pd.Dat
     if mode:
         filtered_df = df[df['mode'] == mode]
     
-    map_dist = filtered_df['map_name'].value_counts().reset_index()
+    # Categorical columns also report unobserved categories, so drop zero counts
+    map_counts = filtered_df['map_name'].value_counts()
+    map_dist = map_counts[map_counts > 0].reset_index()
     map_dist.columns = ['Map', 'Count']
     return map_dist
 